@@ -0,0 +1,53 @@
+"""Measure ALT preprocessing cost and query speedup over dijkstra.
+
+Run with ``python benchmarks/bench_alt.py [grid_side] [landmarks] [queries]``.
+"""
+from __future__ import annotations
+
+import io
+import random
+import sys
+import time
+
+from graph_py.algorithms import LandmarkIndex, alt, astar, dijkstra
+
+from bench_bidirectional_dijkstra import road_grid
+
+
+def main(side: int = 150, landmark_count: int = 8, queries: int = 30) -> None:
+    graph = road_grid(side)
+    csr = graph.to_csr()
+
+    started = time.perf_counter()
+    index = LandmarkIndex.build(csr, k=landmark_count)
+    preprocessing = time.perf_counter() - started
+    buffer = io.BytesIO()
+    index.save(buffer)
+    print(f"nodes={len(csr)} landmarks={landmark_count}")
+    print(f"preprocessing {preprocessing:.2f}s, tables {index.nbytes / 2**20:.1f} MiB, serialized {len(buffer.getvalue()) / 2**20:.1f} MiB")
+
+    rng = random.Random(11)
+    pairs = [(rng.choice(graph.nodes), rng.choice(graph.nodes)) for _ in range(queries)]
+
+    started = time.perf_counter()
+    for source, target in pairs:
+        dijkstra(csr, source, target)
+    baseline = (time.perf_counter() - started) / queries
+
+    plain, guided = {}, {}
+    expansions = [0, 0]
+    started = time.perf_counter()
+    for source, target in pairs:
+        alt(csr, source, target, index, stats=guided)
+        expansions[1] += guided["expansions"]
+    alt_time = (time.perf_counter() - started) / queries
+    for source, target in pairs:
+        astar(csr, source, target, stats=plain)
+        expansions[0] += plain["expansions"]
+
+    print(f"dijkstra {baseline * 1000:8.2f} ms/query  {expansions[0] / queries:9.0f} expansions")
+    print(f"alt      {alt_time * 1000:8.2f} ms/query  {expansions[1] / queries:9.0f} expansions  ({baseline / alt_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:4]])
@@ -0,0 +1,38 @@
+"""Measure batch_shortest_paths throughput against looping over dijkstra.
+
+Run with ``python benchmarks/bench_batch_shortest_paths.py [grid_side] [queries] [workers]``.
+"""
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+
+from graph_py.algorithms import batch_shortest_paths, dijkstra
+
+from bench_bidirectional_dijkstra import road_grid
+
+
+def main(side: int = 100, queries: int = 200, workers: int = 0) -> None:
+    csr = road_grid(side).to_csr()
+    rng = random.Random(5)
+    pairs = [(rng.choice(csr.nodes), rng.choice(csr.nodes)) for _ in range(queries)]
+    workers = workers or os.cpu_count() or 1
+    print(f"nodes={len(csr)} queries={queries} cpus={os.cpu_count()}")
+
+    started = time.perf_counter()
+    expected = [dijkstra(csr, source, target) for source, target in pairs]
+    baseline = time.perf_counter() - started
+    print(f"dijkstra loop        {queries / baseline:8.1f} queries/s")
+
+    for count in sorted({1, 2, workers}):
+        started = time.perf_counter()
+        paths = batch_shortest_paths(csr, pairs, "dijkstra", workers=count)
+        elapsed = time.perf_counter() - started
+        assert paths == expected
+        print(f"batch workers={count:<4d} {queries / elapsed:8.1f} queries/s")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:4]])
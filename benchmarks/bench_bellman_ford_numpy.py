@@ -0,0 +1,38 @@
+"""Compare queue-based and NumPy-vectorized Bellman-Ford on a ~1M-edge graph.
+
+Reuses the reweighted directed grid from ``bench_spfa`` (some negative
+edges, no negative cycles). The pure-Python sweep is only timed on small
+grids because it needs a full pass over every edge per iteration.
+
+Run with ``python benchmarks/bench_bellman_ford_numpy.py [grid_side] [queries]``.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from graph_py.algorithms import single_source_bellman_ford
+
+from bench_spfa import reweighted_grid
+
+
+def main(side: int = 500, queries: int = 3) -> None:
+    started = time.perf_counter()
+    graph = reweighted_grid(side)
+    csr = graph.to_csr()
+    print(f"nodes={len(csr)} edges={csr.edge_count} built in {time.perf_counter() - started:.1f}s")
+
+    rng = random.Random(5)
+    sources = [rng.choice(graph.nodes) for _ in range(queries)]
+    methods = ("sweep", "spfa", "numpy") if side <= 80 else ("spfa", "numpy")
+
+    for method in methods:
+        started = time.perf_counter()
+        for source in sources:
+            single_source_bellman_ford(csr, source, method=method)
+        print(f"{method:6s} {(time.perf_counter() - started) / queries:8.2f} s/source")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
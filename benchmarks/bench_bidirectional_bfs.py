@@ -0,0 +1,42 @@
+"""Compare one-sided and bidirectional BFS on a random small-world graph.
+
+Run with ``python benchmarks/bench_bidirectional_bfs.py [node_count] [degree] [queries]``.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from graph_py.algorithms import bfs
+from graph_py.graphs import UndirectedGraph
+
+
+def small_world(node_count: int, degree: int, seed: int = 7) -> UndirectedGraph:
+    rng = random.Random(seed)
+    graph = UndirectedGraph(id="social")
+    graph.add_nodes_from(f"u{i}" for i in range(node_count))
+    edges = []
+    for i in range(node_count):
+        for k in range(1, degree // 2 + 1):
+            j = (i + k) % node_count if rng.random() > 0.1 else rng.randrange(node_count)
+            edges.append((f"e{i}_{k}", f"u{i}", f"u{j}"))
+    graph.add_edges_from(edges)
+    return graph
+
+
+def main(node_count: int = 100_000, degree: int = 10, queries: int = 20) -> None:
+    graph = small_world(node_count, degree)
+    graph.adjacency
+    rng = random.Random(1)
+    pairs = [(rng.choice(graph.nodes), rng.choice(graph.nodes)) for _ in range(queries)]
+
+    for label, bidirectional in (("one-sided", False), ("bidirectional", True)):
+        started = time.perf_counter()
+        lengths = [len(bfs(graph, s, t, bidirectional=bidirectional) or ()) for s, t in pairs]
+        elapsed = time.perf_counter() - started
+        print(f"{label:<14} {elapsed / queries * 1000:8.2f} ms/query  mean path {sum(lengths) / queries:.1f}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:4]])
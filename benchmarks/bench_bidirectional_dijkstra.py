@@ -0,0 +1,47 @@
+"""Compare one-sided and bidirectional Dijkstra on a weighted grid road network.
+
+Run with ``python benchmarks/bench_bidirectional_dijkstra.py [grid_side] [queries]``.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from graph_py.algorithms import dijkstra
+from graph_py.core import WeightedEdge
+from graph_py.graphs import UndirectedGraph
+
+
+def road_grid(side: int, seed: int = 3) -> UndirectedGraph:
+    rng = random.Random(seed)
+    graph = UndirectedGraph(id="roads")
+    graph.add_nodes_from(f"{r},{c}" for r in range(side) for c in range(side))
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            if c + 1 < side:
+                edges.append((f"h{r},{c}", f"{r},{c}", f"{r},{c + 1}", {"weight": rng.uniform(1, 3)}))
+            if r + 1 < side:
+                edges.append((f"v{r},{c}", f"{r},{c}", f"{r + 1},{c}", {"weight": rng.uniform(1, 3)}))
+    graph.add_edges_from(edges, edge_type=WeightedEdge)
+    return graph
+
+
+def main(side: int = 200, queries: int = 20) -> None:
+    graph = road_grid(side)
+    rng = random.Random(5)
+    pairs = [(rng.choice(graph.nodes), rng.choice(graph.nodes)) for _ in range(queries)]
+
+    for representation, searchable in (("objects", graph), ("csr", graph.to_csr())):
+        searchable.weighted_adjacency if representation == "objects" else searchable.reverse()
+        for label, bidirectional in (("one-sided", False), ("bidirectional", True)):
+            started = time.perf_counter()
+            for source, target in pairs:
+                dijkstra(searchable, source, target, bidirectional=bidirectional)
+            elapsed = time.perf_counter() - started
+            print(f"{representation:<8} {label:<14} {elapsed / queries * 1000:8.2f} ms/query")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
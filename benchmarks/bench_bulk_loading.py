@@ -0,0 +1,49 @@
+"""Benchmark per-item graph construction against the bulk loading API.
+
+Run with ``python benchmarks/bench_bulk_loading.py [node_count]``.
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+from graph_py.core import Edge, Node
+from graph_py.graphs import DirectedGraph
+
+
+def per_item(node_count: int) -> DirectedGraph:
+    graph = DirectedGraph(id="per_item")
+    for i in range(node_count):
+        graph.add_node(Node(id=f"n{i}"))
+    for i in range(node_count - 1):
+        graph.add_edge(Edge(id=f"e{i}", source=f"n{i}", target=f"n{i + 1}"))
+    return graph
+
+
+def bulk(node_count: int) -> DirectedGraph:
+    graph = DirectedGraph(id="bulk")
+    graph.add_nodes_from([f"n{i}" for i in range(node_count)])
+    graph.add_edges_from(
+        {
+            "id": [f"e{i}" for i in range(node_count - 1)],
+            "source": [f"n{i}" for i in range(node_count - 1)],
+            "target": [f"n{i + 1}" for i in range(node_count - 1)],
+        },
+    )
+    return graph
+
+
+def main(node_count: int = 200_000) -> None:
+    runs = [
+        ("add_node/add_edge", lambda: per_item(node_count)),
+        ("add_nodes_from/add_edges_from", lambda: bulk(node_count)),
+    ]
+    for label, run in runs:
+        started = time.perf_counter()
+        graph = run()
+        elapsed = time.perf_counter() - started
+        print(f"{label:<30} {elapsed:6.2f}s  ({len(graph.nodes)} nodes, {len(graph.edges)} edges)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,43 @@
+"""Compare union-find connectivity queries with bfs while edges stream in.
+
+Run with ``python benchmarks/bench_connectivity.py [nodes] [edges] [queries]``.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from graph_py.algorithms import bfs
+from graph_py.graphs import UndirectedGraph
+
+
+def main(node_count: int = 20000, edge_count: int = 12000, queries: int = 200) -> None:
+    rng = random.Random(3)
+    graph = UndirectedGraph(id="stream")
+    graph.add_nodes_from(str(i) for i in range(node_count))
+    graph.connected("0", "0")
+    pairs = [(str(rng.randrange(node_count)), str(rng.randrange(node_count))) for _ in range(queries)]
+    batch = edge_count // queries
+
+    union_find = traversal = 0.0
+    for step, (a, b) in enumerate(pairs):
+        graph.add_edges_from(
+            (f"e{step}-{k}", str(rng.randrange(node_count)), str(rng.randrange(node_count))) for k in range(batch)
+        )
+        started = time.perf_counter()
+        expected = graph.connected(a, b)
+        union_find += time.perf_counter() - started
+
+        started = time.perf_counter()
+        found = bfs(graph, graph.get_node(a), graph.get_node(b)) is not None
+        traversal += time.perf_counter() - started
+        assert found == expected
+
+    print(f"nodes={node_count} edges={len(graph.edges)} queries={queries}")
+    print(f"bfs        {traversal / queries * 1e3:9.3f} ms/query")
+    print(f"union-find {union_find / queries * 1e3:9.3f} ms/query")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:4]])
@@ -0,0 +1,51 @@
+"""Measure contraction-hierarchy preprocessing and query speed against dijkstra.
+
+Run with ``python benchmarks/bench_contraction_hierarchies.py [grid_side] [queries]``.
+"""
+from __future__ import annotations
+
+import io
+import random
+import sys
+import time
+
+from graph_py.algorithms import ContractionHierarchy, dijkstra
+
+from bench_bidirectional_dijkstra import road_grid
+
+
+def main(side: int = 100, queries: int = 50) -> None:
+    graph = road_grid(side)
+    csr = graph.to_csr()
+
+    started = time.perf_counter()
+    hierarchy = ContractionHierarchy.build(csr)
+    preprocessing = time.perf_counter() - started
+    buffer = io.BytesIO()
+    hierarchy.save(buffer)
+    started = time.perf_counter()
+    buffer.seek(0)
+    hierarchy = ContractionHierarchy.load(buffer, csr)
+    loading = time.perf_counter() - started
+    print(f"nodes={len(csr)} edges={csr.edge_count} shortcuts={hierarchy.shortcut_count}")
+    print(f"contraction {preprocessing:.2f}s, load {loading:.3f}s, serialized {len(buffer.getvalue()) / 2**20:.1f} MiB")
+
+    rng = random.Random(5)
+    pairs = [(rng.choice(graph.nodes), rng.choice(graph.nodes)) for _ in range(queries)]
+
+    started = time.perf_counter()
+    for source, target in pairs:
+        dijkstra(csr, source, target)
+    baseline = (time.perf_counter() - started) / queries
+
+    started = time.perf_counter()
+    for source, target in pairs:
+        hierarchy.shortest_path(source, target)
+    ch_time = (time.perf_counter() - started) / queries
+
+    print(f"dijkstra {baseline * 1000:8.2f} ms/query")
+    print(f"ch       {ch_time * 1000:8.2f} ms/query  ({baseline / ch_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,48 @@
+"""Compare blocked Floyd-Warshall with one dijkstra run per source on a dense graph.
+
+Run with ``python benchmarks/bench_floyd_warshall.py [nodes] [out_degree] [block]``.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from graph_py.algorithms import floyd_warshall, single_source_dijkstra
+from graph_py.core import WeightedEdge
+from graph_py.graphs import DirectedGraph
+
+
+def dense_graph(node_count: int, out_degree: int, seed: int = 13) -> DirectedGraph:
+    rng = random.Random(seed)
+    graph = DirectedGraph(id="dense")
+    graph.add_nodes_from(str(i) for i in range(node_count))
+    edges = (
+        (f"{i}>{j}", str(i), str(j), {"weight": rng.uniform(1, 10)})
+        for i in range(node_count)
+        for j in rng.sample(range(node_count), out_degree)
+        if j != i
+    )
+    graph.add_edges_from(edges, edge_type=WeightedEdge)
+    return graph
+
+
+def main(node_count: int = 800, out_degree: int = 80, block: int = 64) -> None:
+    graph = dense_graph(node_count, out_degree)
+    csr = graph.to_csr()
+    print(f"nodes={len(csr)} edges={csr.edge_count}")
+
+    started = time.perf_counter()
+    for source in csr.nodes:
+        single_source_dijkstra(csr, source)
+    print(f"dijkstra per source   {time.perf_counter() - started:7.2f}s")
+
+    for dtype in ("float64", "float32"):
+        started = time.perf_counter()
+        distances, predecessors = floyd_warshall(csr, dtype=dtype, block=block)
+        elapsed = time.perf_counter() - started
+        print(f"floyd-warshall {dtype} {elapsed:7.2f}s  {(distances.nbytes + predecessors.nbytes) / 2**20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:4]])
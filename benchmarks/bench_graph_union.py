@@ -0,0 +1,42 @@
+"""Benchmark graph_union on large directed graphs.
+
+Run with ``python benchmarks/bench_graph_union.py [node_count]``.
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+from graph_py.algorithms import graph_union
+from graph_py.core import Edge, Node
+from graph_py.graphs import DirectedGraph
+
+
+def build_chain(graph_id: str, start: int, count: int) -> DirectedGraph:
+    graph = DirectedGraph(id=graph_id)
+    for i in range(start, start + count):
+        graph.add_node(Node(id=f"n{i}"))
+    for i in range(start, start + count - 1):
+        graph.add_edge(Edge(id=f"e{i}", source=f"n{i}", target=f"n{i + 1}"))
+    return graph
+
+
+def main(node_count: int = 100_000) -> None:
+    half = node_count // 2
+
+    started = time.perf_counter()
+    graph_a = build_chain("a", 0, half + half // 2)
+    graph_b = build_chain("b", half, half + half // 2)
+    build_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = graph_union(graph_a, graph_b)
+    union_time = time.perf_counter() - started
+
+    print(f"nodes={len(result.nodes)} edges={len(result.edges)}")
+    print(f"build inputs: {build_time:.2f}s")
+    print(f"graph_union:  {union_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,34 @@
+"""Time Johnson's all-pairs shortest paths against one Bellman-Ford per source.
+
+Run with ``python benchmarks/bench_johnson.py [grid_side] [workers]``.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+from graph_py.algorithms import johnson, single_source_bellman_ford
+
+from bench_spfa import reweighted_grid
+
+
+def main(side: int = 30, workers: int = 0) -> None:
+    graph = reweighted_grid(side)
+    csr = graph.to_csr()
+    workers = workers or os.cpu_count() or 1
+    print(f"nodes={len(csr)} edges={csr.edge_count}")
+
+    started = time.perf_counter()
+    for source in csr.nodes:
+        single_source_bellman_ford(csr, source, method="spfa")
+    print(f"bellman-ford per source {time.perf_counter() - started:7.2f}s")
+
+    for count in sorted({1, workers}):
+        started = time.perf_counter()
+        johnson(csr, method="spfa", workers=count)
+        print(f"johnson workers={count:<3d}  {time.perf_counter() - started:7.2f}s")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
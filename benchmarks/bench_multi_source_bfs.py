@@ -0,0 +1,72 @@
+"""Compare one BFS per seed with bit-parallel multi-source BFS for hop distances.
+
+MS-BFS pays off when the seeds' frontiers overlap, i.e. on small-diameter
+graphs; the road grid is included as the unfavourable case. Timings use
+the NumPy kernel when NumPy is installed.
+
+Run with ``python benchmarks/bench_multi_source_bfs.py [nodes] [seeds]``.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from array import array
+from collections import deque
+
+from graph_py.algorithms import multi_source_bfs
+from graph_py.graphs import UndirectedGraph
+
+from bench_bidirectional_dijkstra import road_grid
+
+
+def single_source_hops(csr, source):
+    indptr, indices = csr.indptr, csr.indices
+    hops = array("i", [-1]) * len(csr)
+    hops[source] = 0
+    queue = deque([source])
+    while queue:
+        current = queue.popleft()
+        for k in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[k]
+            if hops[neighbor] == -1:
+                hops[neighbor] = hops[current] + 1
+                queue.append(neighbor)
+    return hops
+
+
+def random_graph(node_count: int, average_degree: int = 8, seed: int = 1) -> UndirectedGraph:
+    rng = random.Random(seed)
+    graph = UndirectedGraph(id="random")
+    graph.add_nodes_from(str(i) for i in range(node_count))
+    graph.add_edges_from(
+        (f"e{k}", str(rng.randrange(node_count)), str(rng.randrange(node_count)))
+        for k in range(node_count * average_degree // 2)
+    )
+    return graph
+
+
+def main(node_count: int = 20000, seeds: int = 256) -> None:
+    rng = random.Random(5)
+    side = int(node_count ** 0.5)
+    for label, graph in (("random", random_graph(node_count)), ("grid", road_grid(side))):
+        csr = graph.to_csr()
+        sources = rng.sample(csr.nodes, seeds)
+
+        started = time.perf_counter()
+        expected = [single_source_hops(csr, csr.index[node.id]) for node in sources]
+        baseline = time.perf_counter() - started
+
+        started = time.perf_counter()
+        rows = multi_source_bfs(csr, sources)
+        batched = time.perf_counter() - started
+        assert rows == expected
+
+        print(
+            f"{label:6s} nodes={len(csr)} seeds={seeds}  bfs per seed {baseline:6.2f}s  "
+            f"ms-bfs {batched:6.2f}s  ({baseline / batched:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
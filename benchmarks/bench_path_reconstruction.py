@@ -0,0 +1,105 @@
+"""Compare path-copying BFS/DFS with the predecessor-map implementations.
+
+Run with ``python benchmarks/bench_path_reconstruction.py [chain_length] [grid_side]``.
+"""
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from graph_py.algorithms import bfs, dfs
+from graph_py.graphs import UndirectedGraph
+
+
+def copying_bfs(graph, src_node, trg_node):
+    """Reference: the previous implementation, copying the path per vertex."""
+    adjacency = graph.adjacency
+    visited = {src_node.id}
+    queue = deque([(src_node.id, [src_node.id])])
+    while queue:
+        current_id, path = queue.popleft()
+        for neighbor_id in adjacency.get(current_id, []):
+            if neighbor_id in visited:
+                continue
+            visited.add(neighbor_id)
+            next_path = path + [neighbor_id]
+            if neighbor_id == trg_node.id:
+                return [graph.get_node(node_id) for node_id in next_path]
+            queue.append((neighbor_id, next_path))
+    return None
+
+
+def copying_dfs(graph, src_node, trg_node):
+    """Reference: the previous implementation, copying the path per push."""
+    adjacency = graph.adjacency
+    visited = set()
+    stack = [(src_node.id, [src_node.id])]
+    while stack:
+        current_id, path = stack.pop()
+        if current_id in visited:
+            continue
+        visited.add(current_id)
+        if current_id == trg_node.id:
+            return [graph.get_node(node_id) for node_id in path]
+        for neighbor_id in reversed(adjacency.get(current_id, [])):
+            if neighbor_id not in visited:
+                stack.append((neighbor_id, path + [neighbor_id]))
+    return None
+
+
+def chain(length: int) -> UndirectedGraph:
+    graph = UndirectedGraph(id="chain")
+    graph.add_nodes_from(f"n{i}" for i in range(length))
+    graph.add_edges_from((f"e{i}", f"n{i}", f"n{i + 1}") for i in range(length - 1))
+    return graph
+
+
+def grid(side: int) -> UndirectedGraph:
+    graph = UndirectedGraph(id="grid")
+    graph.add_nodes_from(f"{r},{c}" for r in range(side) for c in range(side))
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            if c + 1 < side:
+                edges.append((f"h{r},{c}", f"{r},{c}", f"{r},{c + 1}"))
+            if r + 1 < side:
+                edges.append((f"v{r},{c}", f"{r},{c}", f"{r + 1},{c}"))
+    graph.add_edges_from(edges)
+    return graph
+
+
+def measure(search, graph, source, target):
+    graph.adjacency  # build the cached view outside the measurement
+    tracemalloc.start()
+    started = time.perf_counter()
+    path = search(graph, source, target)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(path)
+
+
+def main(chain_length: int = 5_000, grid_side: int = 150) -> None:
+    chain_graph = chain(chain_length)
+    grid_graph = grid(grid_side)
+    cases = [
+        ("chain", chain_graph, chain_graph.nodes[0], chain_graph.nodes[-1]),
+        ("grid", grid_graph, grid_graph.nodes[0], grid_graph.nodes[-1]),
+    ]
+    searches = [
+        ("bfs copying", copying_bfs),
+        ("bfs predecessors", bfs),
+        ("dfs copying", copying_dfs),
+        ("dfs predecessors", dfs),
+    ]
+    for label, graph, source, target in cases:
+        for name, search in searches:
+            elapsed, peak, length = measure(search, graph, source, target)
+            print(f"{label:<6} {name:<17} {elapsed:7.3f}s  peak {peak / 2**20:8.1f} MiB  path {length}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,43 @@
+"""Compare construction time and memory of pydantic vs slotted records.
+
+Run with ``python benchmarks/bench_record_modes.py [node_count]``.
+"""
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+
+from graph_py.graphs import DirectedGraph
+
+
+def build(record_mode: str, node_count: int) -> DirectedGraph:
+    graph = DirectedGraph(id=record_mode, record_mode=record_mode)
+    graph.add_nodes_from(f"n{i}" for i in range(node_count))
+    graph.add_edges_from((f"e{i}", f"n{i}", f"n{i + 1}") for i in range(node_count - 1))
+    return graph
+
+
+def main(node_count: int = 1_000_000) -> None:
+    for record_mode in ("pydantic", "slots"):
+        started = time.perf_counter()
+        graph = build(record_mode, node_count)
+        elapsed = time.perf_counter() - started
+        element_count = len(graph.nodes) + len(graph.edges)
+        del graph
+
+        tracemalloc.start()
+        graph = build(record_mode, node_count)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del graph
+
+        print(
+            f"{record_mode:<9} build {elapsed:6.2f}s  "
+            f"retained {retained / 2**20:7.1f} MiB ({retained / element_count:.0f} B/element)  "
+            f"peak {peak / 2**20:7.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,59 @@
+"""Compare sweeping and queue-based (SPFA) Bellman-Ford on a sparse directed grid.
+
+A random potential reweights the grid (w + p(u) - p(v)), which turns some
+edges negative without creating negative cycles.
+
+Run with ``python benchmarks/bench_spfa.py [grid_side] [queries]``.
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from graph_py.algorithms import bellman_ford
+from graph_py.core import WeightedEdge
+from graph_py.graphs import DirectedGraph
+
+
+def reweighted_grid(side: int, seed: int = 7) -> DirectedGraph:
+    rng = random.Random(seed)
+    potential = {f"{r},{c}": rng.uniform(0, 1.5) for r in range(side) for c in range(side)}
+    graph = DirectedGraph(id="reweighted")
+    graph.add_nodes_from(list(potential))
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            here = f"{r},{c}"
+            for there in (f"{r},{c + 1}" if c + 1 < side else None, f"{r + 1},{c}" if r + 1 < side else None):
+                if there is None:
+                    continue
+                for tail, head in ((here, there), (there, here)):
+                    weight = rng.uniform(1, 3) + potential[tail] - potential[head]
+                    edges.append((f"{tail}>{head}", tail, head, {"weight": weight}))
+    graph.add_edges_from(edges, edge_type=WeightedEdge)
+    return graph
+
+
+def main(side: int = 60, queries: int = 3) -> None:
+    graph = reweighted_grid(side)
+    negative = sum(1 for edge in graph.edges if edge.weight < 0)
+    print(f"nodes={len(graph.nodes)} edges={len(graph.edges)} negative={negative}")
+    rng = random.Random(5)
+    pairs = [(rng.choice(graph.nodes), rng.choice(graph.nodes)) for _ in range(queries)]
+
+    for representation, searchable in (("objects", graph), ("csr", graph.to_csr())):
+        timings = {}
+        for method in ("sweep", "spfa"):
+            started = time.perf_counter()
+            for source, target in pairs:
+                bellman_ford(searchable, source, target, method=method)
+            timings[method] = (time.perf_counter() - started) / queries
+        print(
+            f"{representation:8s} sweep {timings['sweep'] * 1000:9.1f} ms/query  "
+            f"spfa {timings['spfa'] * 1000:8.1f} ms/query  ({timings['sweep'] / timings['spfa']:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
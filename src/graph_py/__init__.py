@@ -1,7 +1,8 @@
 """Public package exports."""
 
-from .core import Graph, Node, Edge
-from .graphs import DirectedGraph, UndirectedGraph
+from .core import Graph, Node, Edge, WeightedEdge, NodeRecord, EdgeRecord
+from .disjoint_set import DisjointSet
+from .graphs import CSRGraph, DirectedGraph, UndirectedGraph
 
-__all__ = ['Graph', 'Node', 'Edge', 'DirectedGraph', 'UndirectedGraph']
+__all__ = ['Graph', 'Node', 'Edge', 'WeightedEdge', 'NodeRecord', 'EdgeRecord', 'DirectedGraph', 'UndirectedGraph', 'CSRGraph', 'DisjointSet']
 
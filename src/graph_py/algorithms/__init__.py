@@ -1,5 +1,14 @@
+from .alt import *
+from .astar import *
+from .batch import *
 from .bellman_ford import *
 from .bfs import *
+from .contraction_hierarchies import *
 from .dfs import *
 from .dijkstra import *
+from .floyd_warshall import *
+from .johnson import *
+from .multi_source_bfs import *
 from .set_operations import *
+from .shortest_path_tree import *
+from .strongly_connected import *
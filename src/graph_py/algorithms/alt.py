@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+from array import array
+from math import inf
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
+
+from ..core import Graph, Node
+from ..graphs.csr import CSRGraph
+from .astar import Heuristic, astar
+from .dijkstra import _dijkstra_distances
+
+_MAGIC = b"GRAPHPY-ALT 1\n"
+
+
+class LandmarkIndex:
+    """Precomputed landmark distance tables for ALT shortest-path queries.
+
+    For every landmark ``L`` the tables hold ``d(L, v)`` and ``d(v, L)`` for
+    all nodes ``v`` (a single table on symmetric graphs), stored as one flat
+    ``array('d')`` each. By the triangle inequality they give admissible
+    A* bounds. The tables describe the graph they were built from; rebuild
+    them after changing its structure or weights.
+    """
+
+    __slots__ = ("node_ids", "landmarks", "forward", "backward", "_index", "_heuristic")
+
+    def __init__(self, node_ids: Sequence[str], landmarks: Sequence[str], forward: array, backward: array) -> None:
+        self.node_ids = list(node_ids)
+        self.landmarks = list(landmarks)
+        self.forward = forward
+        self.backward = backward
+        self._index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        self._heuristic: Optional[Heuristic] = None
+
+    @classmethod
+    def build(cls, graph: Union[Graph, CSRGraph], k: int = 8, *, strategy: str = "farthest") -> LandmarkIndex:
+        """Pick ``k`` landmarks (``"farthest"`` or ``"degree"``) and compute their tables."""
+        csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+        reverse = csr.reverse()
+        node_count = len(csr)
+        k = min(k, node_count)
+
+        def degree(i: int) -> int:
+            return csr.degree(i) + reverse.degree(i) if csr.directed else csr.degree(i)
+
+        def round_trip(i: int) -> Tuple[List[float], List[float]]:
+            from_landmark = _dijkstra_distances(csr.indptr, csr.indices, csr.weights, i)
+            if not csr.directed:
+                return from_landmark, from_landmark
+            return from_landmark, _dijkstra_distances(reverse.indptr, reverse.indices, reverse.weights, i)
+
+        if strategy == "degree":
+            chosen = sorted(range(node_count), key=degree, reverse=True)[:k]
+        elif strategy == "farthest":
+            chosen = []
+            # Seed farthest-point selection from the best connected node.
+            from_seed, to_seed = round_trip(max(range(node_count), key=degree)) if node_count else ([], [])
+            nearest = [a + b for a, b in zip(from_seed, to_seed)]
+        else:
+            raise ValueError(f"Unknown landmark strategy '{strategy}'")
+
+        forward = array("d")
+        backward = array("d")
+        for position in range(k):
+            if strategy == "farthest":
+                # Unreached nodes (inf) win first, which spreads landmarks over components.
+                taken = set(chosen)
+                landmark = max((i for i in range(node_count) if i not in taken), key=nearest.__getitem__)
+                chosen.append(landmark)
+            else:
+                landmark = chosen[position]
+
+            from_landmark, to_landmark = round_trip(landmark)
+            forward.extend(from_landmark)
+            if csr.directed:
+                backward.extend(to_landmark)
+            if strategy == "farthest":
+                for i in range(node_count):
+                    nearest[i] = min(nearest[i], from_landmark[i] + to_landmark[i])
+
+        return cls(csr.node_ids, [csr.node_ids[i] for i in chosen], forward, backward if csr.directed else forward)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the distance tables."""
+        size = self.forward.itemsize * len(self.forward)
+        if self.backward is not self.forward:
+            size += self.backward.itemsize * len(self.backward)
+        return size
+
+    def lower_bound(self, node_id: str, target_id: str) -> float:
+        """Triangle-inequality lower bound on the distance node_id -> target_id.
+
+        Returns ``inf`` when the tables prove the target unreachable.
+        """
+        v, t = self._index.get(node_id), self._index.get(target_id)
+        if v is None or t is None:
+            return 0.0
+        node_count = len(self.node_ids)
+        forward, backward = self.forward, self.backward
+        symmetric = backward is forward
+        best = 0.0
+        for base in range(0, len(forward), node_count):
+            # d(v, t) >= d(L, t) - d(L, v); L reaching v but not t rules t out.
+            from_node, from_target = forward[base + v], forward[base + t]
+            if from_node != inf and from_target != inf:
+                if from_target - from_node > best:
+                    best = from_target - from_node
+            elif from_node != inf:
+                return inf
+            if symmetric:
+                if from_node - from_target > best:
+                    best = from_node - from_target
+                continue
+            # d(v, t) >= d(v, L) - d(t, L); t reaching L but not v rules t out.
+            to_node, to_target = backward[base + v], backward[base + t]
+            if to_node != inf and to_target != inf:
+                if to_node - to_target > best:
+                    best = to_node - to_target
+            elif to_target != inf:
+                return inf
+        return best
+
+    def heuristic(self) -> Heuristic:
+        """The landmark bound as an A* heuristic."""
+        if self._heuristic is None:
+            lower_bound = self.lower_bound
+            self._heuristic = lambda node, target: lower_bound(node.id, target.id)
+        return self._heuristic
+
+    def save(self, file: Union[str, BinaryIO]) -> None:
+        """Serialize to a path or binary file object."""
+        if isinstance(file, str):
+            with open(file, "wb") as handle:
+                self.save(handle)
+            return
+        header = {
+            "node_ids": self.node_ids,
+            "landmarks": self.landmarks,
+            "symmetric": self.backward is self.forward,
+        }
+        file.write(_MAGIC)
+        file.write(json.dumps(header).encode("utf-8") + b"\n")
+        file.write(self.forward.tobytes())
+        if self.backward is not self.forward:
+            file.write(self.backward.tobytes())
+
+    @classmethod
+    def load(cls, file: Union[str, BinaryIO]) -> LandmarkIndex:
+        """Read an index written by ``save``."""
+        if isinstance(file, str):
+            with open(file, "rb") as handle:
+                return cls.load(handle)
+        if file.readline() != _MAGIC:
+            raise ValueError("Not a graph-py landmark index")
+        header = json.loads(file.readline().decode("utf-8"))
+        size = len(header["node_ids"]) * len(header["landmarks"])
+        forward = _read_doubles(file, size)
+        backward = forward if header["symmetric"] else _read_doubles(file, size)
+        return cls(header["node_ids"], header["landmarks"], forward, backward)
+
+
+def alt(
+    graph: Union[Graph, CSRGraph],
+    src_node: Node,
+    trg_node: Node,
+    landmarks: LandmarkIndex,
+    *,
+    stats: Optional[Dict[str, int]] = None,
+) -> Optional[List[Node]]:
+    """A* search bounded by precomputed landmark distances."""
+    return astar(graph, src_node, trg_node, landmarks.heuristic(), stats=stats)
+
+
+def _read_doubles(file: BinaryIO, count: int) -> array:
+    values = array("d")
+    values.frombytes(file.read(count * values.itemsize))
+    if len(values) != count:
+        raise ValueError("Truncated landmark index")
+    return values
+
+
+__all__ = ["LandmarkIndex", "alt"]
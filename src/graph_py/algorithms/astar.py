@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from heapq import heappop, heappush
+from math import asin, cos, inf, radians, sin, sqrt
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from ..core import Graph, Node
+from ..graphs.csr import CSRGraph
+
+Heuristic = Callable[[Node, Node], float]
+
+
+def astar(
+    graph: Union[Graph, CSRGraph],
+    src_node: Node,
+    trg_node: Node,
+    heuristic: Optional[Heuristic] = None,
+    *,
+    stats: Optional[Dict[str, int]] = None,
+) -> Optional[List[Node]]:
+    """Compute a shortest path with A*, guided by ``heuristic(node, target)``.
+
+    The heuristic must not overestimate the remaining distance for the
+    result to be optimal; without one the search behaves like dijkstra.
+    Each node's heuristic value is computed at most once per query. When a
+    ``stats`` dict is given, the number of expanded nodes is stored under
+    ``"expansions"``.
+    """
+    assert (
+        src_node in graph and trg_node in graph
+    ), "target and source node need to be in the same graph"
+
+    if stats is not None:
+        stats["expansions"] = 0
+    if src_node.id == trg_node.id:
+        return [src_node]
+
+    if isinstance(graph, CSRGraph):
+        indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+        path = _astar(
+            lambda node: zip(indices[indptr[node]:indptr[node + 1]], weights[indptr[node]:indptr[node + 1]]),
+            graph.nodes.__getitem__,
+            graph.index[src_node.id],
+            graph.index[trg_node.id],
+            heuristic,
+            stats,
+        )
+        return None if path is None else graph.path_nodes(path)
+
+    adjacency = graph.weighted_adjacency
+    path_ids = _astar(
+        lambda node_id: adjacency.get(node_id, ()),
+        graph.get_node,
+        src_node.id,
+        trg_node.id,
+        heuristic,
+        stats,
+    )
+    return None if path_ids is None else [graph.get_node(node_id) for node_id in path_ids]
+
+
+def _astar(
+    neighbors: Callable[[Hashable], Iterable[Tuple[Hashable, float]]],
+    resolve: Callable[[Hashable], Node],
+    source: Hashable,
+    target: Hashable,
+    heuristic: Optional[Heuristic],
+    stats: Optional[Dict[str, int]],
+) -> Optional[List[Hashable]]:
+    target_node = resolve(target)
+    estimates: Dict[Hashable, float] = {}
+
+    def estimate(key: Hashable) -> float:
+        value = estimates.get(key)
+        if value is None:
+            value = estimates[key] = heuristic(resolve(key), target_node) if heuristic else 0.0
+        return value
+
+    distances: Dict[Hashable, float] = {source: 0.0}
+    previous: Dict[Hashable, Optional[Hashable]] = {source: None}
+    heap: List[Tuple[float, float, Hashable]] = [(estimate(source), 0.0, source)]
+    expansions = 0
+
+    while heap:
+        _, current_distance, current = heappop(heap)
+        if current_distance > distances[current]:
+            continue
+
+        if current == target:
+            break
+
+        expansions += 1
+        for neighbor, weight in neighbors(current):
+            if weight < 0:
+                raise ValueError("A* search requires non-negative edge weights")
+
+            candidate_distance = current_distance + weight
+            if candidate_distance < distances.get(neighbor, inf):
+                distances[neighbor] = candidate_distance
+                previous[neighbor] = current
+                heappush(heap, (candidate_distance + estimate(neighbor), candidate_distance, neighbor))
+
+    if stats is not None:
+        stats["expansions"] = expansions
+
+    if target not in distances:
+        return None
+
+    path: List[Hashable] = []
+    node: Optional[Hashable] = target
+    while node is not None:
+        path.append(node)
+        node = previous[node]
+    path.reverse()
+    return path
+
+
+def euclidean_heuristic(x_key: str = "x", y_key: str = "y", *, scale: float = 1.0) -> Heuristic:
+    """Straight-line distance between node coordinates stored as properties.
+
+    ``scale`` converts coordinate units into edge-weight units; it must not
+    exceed the smallest weight per unit of distance to stay admissible.
+    Nodes without coordinates get an estimate of 0.
+    """
+
+    def heuristic(node: Node, target: Node) -> float:
+        a, b = _coordinates(node, x_key, y_key), _coordinates(target, x_key, y_key)
+        if a is None or b is None:
+            return 0.0
+        return scale * sqrt((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2)
+
+    return heuristic
+
+
+def haversine_heuristic(
+    lat_key: str = "lat", lon_key: str = "lon", *, radius: float = 6371.0088, scale: float = 1.0
+) -> Heuristic:
+    """Great-circle distance between ``lat``/``lon`` properties (degrees).
+
+    The default radius yields kilometres; ``scale`` converts them into
+    edge-weight units. Nodes without coordinates get an estimate of 0.
+    """
+
+    def heuristic(node: Node, target: Node) -> float:
+        a, b = _coordinates(node, lat_key, lon_key), _coordinates(target, lat_key, lon_key)
+        if a is None or b is None:
+            return 0.0
+        lat_a, lon_a, lat_b, lon_b = map(radians, (a[0], a[1], b[0], b[1]))
+        h = sin((lat_b - lat_a) / 2) ** 2 + cos(lat_a) * cos(lat_b) * sin((lon_b - lon_a) / 2) ** 2
+        return scale * 2 * radius * asin(min(1.0, sqrt(h)))
+
+    return heuristic
+
+
+def _coordinates(node: Node, first_key: str, second_key: str) -> Optional[Tuple[float, float]]:
+    properties = getattr(node, "properties", None)
+    if not isinstance(properties, dict):
+        return None
+    first, second = properties.get(first_key), properties.get(second_key)
+    if first is None or second is None:
+        return None
+    return float(first), float(second)
+
+
+__all__ = ["astar", "euclidean_heuristic", "haversine_heuristic"]
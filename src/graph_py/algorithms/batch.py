@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from ..core import Graph, NegativeCycleError, Node
+from ..graphs.csr import CSRGraph
+from .bellman_ford import _bellman_ford_indices
+from .bfs import _bfs_indices
+from .dfs import _dfs_indices
+from .dijkstra import _dijkstra_indices
+
+IndexPair = Tuple[int, int]
+
+# Kernels over (indptr, indices, weights) buffers, keyed by algorithm name.
+_KERNELS: Dict[str, Callable[..., Optional[List[int]]]] = {
+    "bfs": lambda indptr, indices, weights, source, target: _bfs_indices(indptr, indices, source, target),
+    "dfs": lambda indptr, indices, weights, source, target: _dfs_indices(indptr, indices, source, target),
+    "dijkstra": _dijkstra_indices,
+    "bellman_ford": _bellman_ford_indices,
+}
+
+_worker_state: Optional[tuple] = None
+
+
+def batch_shortest_paths(
+    graph: Union[Graph, CSRGraph],
+    pairs: Sequence[Tuple[Node, Node]],
+    algorithm: str = "dijkstra",
+    *,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> List[Optional[List[Node]]]:
+    """Answer many ``(source, target)`` path queries, in order.
+
+    ``algorithm`` is one of ``"bfs"``, ``"dfs"``, ``"dijkstra"`` or
+    ``"bellman_ford"``; results match calling that function per pair. With
+    ``workers > 1`` the CSR snapshot is copied once into shared memory and
+    chunks of queries run on a ``ProcessPoolExecutor`` whose workers map
+    the buffers without copying them.
+    """
+    kernel = _KERNELS.get(algorithm)
+    if kernel is None:
+        raise ValueError(f"Unknown path algorithm '{algorithm}'")
+
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    queries: List[IndexPair] = []
+    for src_node, trg_node in pairs:
+        assert (
+            src_node in csr and trg_node in csr
+        ), "target and source node need to be in the same graph"
+        queries.append((csr.index[src_node.id], csr.index[trg_node.id]))
+
+    try:
+        if workers is None or workers <= 1 or len(queries) < 2:
+            paths = _run_queries(kernel, (csr.indptr, csr.indices, csr.weights), queries)
+        else:
+            paths = _run_parallel(csr, algorithm, queries, workers, chunk_size)
+    except NegativeCycleError as error:
+        error.cycle = csr.path_nodes(error.cycle)
+        raise
+
+    return [None if path is None else csr.path_nodes(path) for path in paths]
+
+
+def _run_queries(
+    kernel: Callable[..., Optional[List[int]]],
+    buffers: Tuple[Sequence[int], Sequence[int], Sequence[float]],
+    queries: Sequence[IndexPair],
+) -> List[Optional[List[int]]]:
+    indptr, indices, weights = buffers
+    return [
+        [source] if source == target else kernel(indptr, indices, weights, source, target)
+        for source, target in queries
+    ]
+
+
+def _run_parallel(
+    csr: CSRGraph,
+    algorithm: str,
+    queries: List[IndexPair],
+    workers: int,
+    chunk_size: Optional[int],
+) -> List[Optional[List[int]]]:
+    sizes = (len(csr.indptr), len(csr.indices))
+    block = shared_memory.SharedMemory(create=True, size=max(1, 8 * (sizes[0] + 2 * sizes[1])))
+    try:
+        offset = 0
+        for buffer in (csr.indptr, csr.indices, csr.weights):
+            raw = buffer.tobytes()
+            block.buf[offset:offset + len(raw)] = raw
+            offset += len(raw)
+
+        size = chunk_size or max(1, -(-len(queries) // (workers * 4)))
+        chunks = [queries[start:start + size] for start in range(0, len(queries), size)]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_attach_worker, initargs=(block.name, sizes, algorithm)
+        ) as executor:
+            return [path for paths in executor.map(_worker_queries, chunks) for path in paths]
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _attach_worker(name: str, sizes: Tuple[int, int], algorithm: str) -> None:
+    """Map the shared CSR buffers into this worker process."""
+    global _worker_state
+    block = shared_memory.SharedMemory(name=name)
+    view = block.buf
+    indptr_end = 8 * sizes[0]
+    indices_end = indptr_end + 8 * sizes[1]
+    buffers = (
+        view[:indptr_end].cast("q"),
+        view[indptr_end:indices_end].cast("q"),
+        view[indices_end:indices_end + 8 * sizes[1]].cast("d"),
+    )
+    _worker_state = (block, buffers, _KERNELS[algorithm])
+
+
+def _worker_queries(queries: List[IndexPair]) -> List[Optional[List[int]]]:
+    _, buffers, kernel = _worker_state
+    return _run_queries(kernel, buffers, queries)
+
+
+__all__ = ["batch_shortest_paths"]
@@ -1,90 +1,317 @@
 from __future__ import annotations
 
+from collections import deque
 from math import inf
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
 
-from ..core import Graph, Node
+from ..core import Graph, NegativeCycleError, Node
+from ..graphs.csr import CSRGraph
+from .shortest_path_tree import ShortestPathTree
 
+_CYCLE_MESSAGE = "Bellman-Ford algorithm detected a negative-weight cycle"
+_METHODS = ("sweep", "spfa", "numpy")
 
-def bellman_ford(graph: Graph, src_node: Node, trg_node: Node) -> Optional[List[Node]]:
-    """Compute the shortest path allowing negative edge weights."""
+
+def bellman_ford(
+    graph: Union[Graph, CSRGraph],
+    src_node: Node,
+    trg_node: Node,
+    *,
+    method: str = "sweep",
+) -> Optional[List[Node]]:
+    """Compute the shortest path allowing negative edge weights.
+
+    ``method="sweep"`` relaxes every edge per pass; ``method="spfa"`` keeps
+    a FIFO queue of nodes whose distance changed and only relaxes their
+    out-edges, which is much faster on sparse graphs with few negative
+    edges. ``method="numpy"`` runs vectorized passes over the CSR edge
+    arrays (requires NumPy). All raise ``NegativeCycleError`` carrying the
+    cycle's nodes.
+    """
     assert (
-        src_node in graph.nodes and trg_node in graph.nodes
+        src_node in graph and trg_node in graph
     ), "target and source node need to be in the same graph"
 
     if src_node.id == trg_node.id:
         return [src_node]
 
-    adjacency = graph.adjacency
-    id_to_node = {node.id: node for node in graph.nodes}
+    if isinstance(graph, CSRGraph) and method == "sweep":
+        try:
+            path = _bellman_ford_indices(
+                graph.indptr, graph.indices, graph.weights, graph.index[src_node.id], graph.index[trg_node.id]
+            )
+        except NegativeCycleError as error:
+            error.cycle = graph.path_nodes(error.cycle)
+            raise
+        return None if path is None else graph.path_nodes(path)
+
+    return single_source_bellman_ford(graph, src_node, method=method).path_to(trg_node)
+
+
+def single_source_bellman_ford(
+    graph: Union[Graph, CSRGraph],
+    src_node: Node,
+    *,
+    cutoff: Optional[float] = None,
+    method: str = "sweep",
+) -> ShortestPathTree:
+    """Run Bellman-Ford from src_node and keep every distance and predecessor.
+
+    Nodes farther than ``cutoff`` are left out of the tree; negative weights
+    can bring a node back under the radius through farther ones, so the
+    full relaxation always runs.
+    """
+    assert src_node in graph, "source node needs to be in the graph"
+    if method not in _METHODS:
+        raise ValueError(f"Unknown Bellman-Ford method '{method}'")
+
+    if method == "numpy":
+        csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+        node_ids = csr.node_ids
+        try:
+            distance_array, previous_array = _bellman_ford_numpy(*csr.to_numpy(), csr.index[src_node.id])
+        except NegativeCycleError as error:
+            error.cycle = csr.path_nodes(error.cycle)
+            raise
+        distance_list, previous_list = distance_array.tolist(), previous_array.tolist()
+        reached = [i for i, distance in enumerate(distance_list) if distance != inf]
+        distances = {node_ids[i]: distance_list[i] for i in reached}
+        previous = {node_ids[i]: None if previous_list[i] == -1 else node_ids[previous_list[i]] for i in reached}
+    elif isinstance(graph, CSRGraph):
+        indptr, indices, weights, node_ids = graph.indptr, graph.indices, graph.weights, graph.node_ids
+        source = graph.index[src_node.id]
+        try:
+            if method == "spfa":
+                reached, parents = _spfa_tree(
+                    lambda node: zip(indices[indptr[node]:indptr[node + 1]], weights[indptr[node]:indptr[node + 1]]),
+                    source,
+                    len(graph),
+                )
+                distances = {node_ids[i]: distance for i, distance in reached.items()}
+                previous = {node_ids[i]: None if parent is None else node_ids[parent] for i, parent in parents.items()}
+            else:
+                distance_list, previous_list = _bellman_ford_tree_indices(indptr, indices, weights, source)
+                distances = {node_ids[i]: distance for i, distance in enumerate(distance_list) if distance != inf}
+                previous = {
+                    node_ids[i]: None if previous_list[i] == -1 else node_ids[previous_list[i]]
+                    for i, distance in enumerate(distance_list)
+                    if distance != inf
+                }
+        except NegativeCycleError as error:
+            error.cycle = graph.path_nodes(error.cycle)
+            raise
+    else:
+        adjacency = graph.weighted_adjacency
+        try:
+            if method == "spfa":
+                distances, previous = _spfa_tree(
+                    lambda node_id: adjacency.get(node_id, ()), src_node.id, len(graph.nodes)
+                )
+            else:
+                distances, previous = _bellman_ford_tree(adjacency, src_node.id, len(graph.nodes))
+        except NegativeCycleError as error:
+            error.cycle = [graph.get_node(node_id) for node_id in error.cycle]
+            raise
+
+    if cutoff is not None:
+        distances = {node_id: distance for node_id, distance in distances.items() if distance <= cutoff}
+    return ShortestPathTree(graph, src_node, distances, previous)
 
-    distances: Dict[str, float] = {node.id: inf for node in graph.nodes}
-    previous: Dict[str, Optional[str]] = {node.id: None for node in graph.nodes}
-    distances[src_node.id] = 0.0
 
-    weight_lookup = _build_weight_lookup(graph)
-    edges = _expand_edges(adjacency, weight_lookup)
+def _bellman_ford_tree(
+    adjacency: Dict[str, List[Tuple[str, float]]],
+    source: str,
+    node_count: int,
+) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+    """Bellman-Ford sweeps over a weighted adjacency map."""
+    distances: Dict[str, float] = {source: 0.0}
+    previous: Dict[str, Optional[str]] = {source: None}
 
-    for _ in range(len(graph.nodes) - 1):
+    for _ in range(node_count - 1):
         updated = False
-        for source_id, target_id, weight in edges:
-            if distances[source_id] == inf:
+        for source_id, targets in adjacency.items():
+            source_distance = distances.get(source_id, inf)
+            if source_distance == inf:
                 continue
-            candidate = distances[source_id] + weight
-            if candidate < distances[target_id]:
-                distances[target_id] = candidate
-                previous[target_id] = source_id
-                updated = True
+            for target_id, weight in targets:
+                candidate = source_distance + weight
+                if candidate < distances.get(target_id, inf):
+                    distances[target_id] = candidate
+                    previous[target_id] = source_id
+                    updated = True
         if not updated:
             break
 
-    for source_id, target_id, weight in edges:
-        if distances[source_id] + weight < distances[target_id]:
-            raise ValueError("Bellman-Ford algorithm detected a negative-weight cycle")
+    for source_id, targets in adjacency.items():
+        source_distance = distances.get(source_id, inf)
+        for target_id, weight in targets:
+            if source_distance + weight < distances.get(target_id, inf):
+                previous[target_id] = source_id
+                raise NegativeCycleError(_CYCLE_MESSAGE, _trace_cycle(previous, target_id, node_count, None))
+
+    return distances, previous
+
+
+def _spfa_tree(
+    neighbors: Callable[[Hashable], Iterable[Tuple[Hashable, float]]],
+    source: Hashable,
+    node_count: int,
+) -> Tuple[Dict[Hashable, float], Dict[Hashable, Optional[Hashable]]]:
+    """Queue-based Bellman-Ford (SPFA).
+
+    Each node remembers how many edges its current path uses; reaching
+    ``node_count`` edges means the path repeats a node, i.e. a negative
+    cycle, which is then read off the predecessor links.
+    """
+    distances: Dict[Hashable, float] = {source: 0.0}
+    previous: Dict[Hashable, Optional[Hashable]] = {source: None}
+    hops: Dict[Hashable, int] = {source: 0}
+    queue = deque([source])
+    queued = {source}
+
+    while queue:
+        current = queue.popleft()
+        queued.discard(current)
+        current_distance = distances[current]
+        depth = hops[current] + 1
+        for neighbor, weight in neighbors(current):
+            candidate = current_distance + weight
+            if candidate < distances.get(neighbor, inf):
+                distances[neighbor] = candidate
+                previous[neighbor] = current
+                hops[neighbor] = depth
+                if depth >= node_count:
+                    raise NegativeCycleError(_CYCLE_MESSAGE, _trace_cycle(previous, neighbor, node_count, None))
+                if neighbor not in queued:
+                    queued.add(neighbor)
+                    queue.append(neighbor)
+
+    return distances, previous
+
+
+def _bellman_ford_numpy(indptr, indices, weights, source: int):
+    """Vectorized Bellman-Ford over NumPy CSR arrays.
+
+    Each pass gathers the out-edges of the nodes changed by the previous
+    pass straight from the CSR ranges, relaxes them at once and scatters
+    the candidates with ``np.minimum.at``. Returns ``(distances, previous)``
+    arrays, ``previous`` holding -1 for the source and unreached nodes.
+    """
+    import numpy as np
+
+    node_count = len(indptr) - 1
+    distances = np.full(node_count, inf)
+    previous = np.full(node_count, -1, dtype=np.int64)
+    distances[source] = 0.0
+    frontier = np.array([source], dtype=np.int64)
+
+    for _ in range(node_count - 1):
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            break
+        edges = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+        tails, heads = np.repeat(frontier, counts), indices[edges]
+        candidates = distances[tails] + weights[edges]
+        improving = candidates < distances[heads]
+        if not improving.any():
+            break
+        tails, heads, candidates = tails[improving], heads[improving], candidates[improving]
+        np.minimum.at(distances, heads, candidates)
+        won = candidates == distances[heads]
+        previous[heads[won]] = tails[won]
+        frontier = np.unique(heads[won])
+
+    sources = np.repeat(np.arange(node_count, dtype=np.int64), np.diff(indptr))
+    violated = np.flatnonzero(distances[sources] + weights < distances[indices])
+    if violated.size:
+        edge = violated[0]
+        previous[indices[edge]] = sources[edge]
+        cycle = _trace_cycle(previous.tolist(), int(indices[edge]), node_count, -1)
+        raise NegativeCycleError(_CYCLE_MESSAGE, cycle)
+
+    return distances, previous
+
+
+def _trace_cycle(previous, start: Hashable, node_count: int, missing: Optional[int]) -> List[Hashable]:
+    """Cycle reached by following predecessors from start, in edge order.
+
+    ``node_count`` steps back from start are guaranteed to land on the cycle
+    unless the walk ends at the source (``missing``), in which case no cycle
+    is returned.
+    """
+    node = start
+    for _ in range(node_count):
+        node = previous[node]
+        if node == missing:
+            return []
 
-    if distances[trg_node.id] == inf:
+    cycle = [node]
+    current = previous[node]
+    while current != node:
+        cycle.append(current)
+        current = previous[current]
+    cycle.reverse()
+    return cycle
+
+
+def _bellman_ford_indices(
+    indptr: Sequence[int],
+    indices: Sequence[int],
+    weights: Sequence[float],
+    source: int,
+    target: int,
+) -> Optional[List[int]]:
+    """Bellman-Ford over CSR buffers, returning the path as node indices."""
+    distances, previous = _bellman_ford_tree_indices(indptr, indices, weights, source)
+
+    if distances[target] == inf:
         return None
 
-    path_ids: List[str] = []
-    current_id: Optional[str] = trg_node.id
-    while current_id is not None:
-        path_ids.append(current_id)
-        current_id = previous[current_id]
-    path_ids.reverse()
+    path = [target]
+    while previous[path[-1]] != -1:
+        path.append(previous[path[-1]])
+    path.reverse()
+    return path
 
-    return [id_to_node[node_id] for node_id in path_ids]
 
+def _bellman_ford_tree_indices(
+    indptr: Sequence[int],
+    indices: Sequence[int],
+    weights: Sequence[float],
+    source: int,
+) -> Tuple[List[float], List[int]]:
+    """Bellman-Ford sweeps over CSR buffers: distances and predecessor indices."""
+    node_count = len(indptr) - 1
+    distances = [inf] * node_count
+    previous = [-1] * node_count
+    distances[source] = 0.0
 
-def _build_weight_lookup(graph: Graph) -> Dict[Tuple[str, str], float]:
-    lookup: Dict[Tuple[str, str], float] = {}
-    for edge in graph.edges:
-        weight = getattr(edge, "weight", 1.0)
-        try:
-            lookup[(edge.source, edge.target)] = float(weight)
-        except (TypeError, ValueError):
-            lookup[(edge.source, edge.target)] = 1.0
-    return lookup
-
-
-def _resolve_weight(
-    lookup: Dict[Tuple[str, str], float], source: str, target: str
-) -> float:
-    if (source, target) in lookup:
-        return lookup[(source, target)]
-    if (target, source) in lookup:
-        return lookup[(target, source)]
-    return 1.0
-
-
-def _expand_edges(
-    adjacency: Dict[str, List[str]],
-    lookup: Dict[Tuple[str, str], float],
-) -> List[Tuple[str, str, float]]:
-    edges: List[Tuple[str, str, float]] = []
-    for source_id, targets in adjacency.items():
-        for target_id in targets:
-            edges.append((source_id, target_id, _resolve_weight(lookup, source_id, target_id)))
-    return edges
+    for _ in range(node_count - 1):
+        updated = False
+        for current in range(node_count):
+            current_distance = distances[current]
+            if current_distance == inf:
+                continue
+            for k in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[k]
+                candidate = current_distance + weights[k]
+                if candidate < distances[neighbor]:
+                    distances[neighbor] = candidate
+                    previous[neighbor] = current
+                    updated = True
+        if not updated:
+            break
+
+    for current in range(node_count):
+        for k in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[k]
+            if distances[current] + weights[k] < distances[neighbor]:
+                previous[neighbor] = current
+                raise NegativeCycleError(_CYCLE_MESSAGE, _trace_cycle(previous, neighbor, node_count, -1))
+
+    return distances, previous
 
 
-__all__ = ["bellman_ford"]
+__all__ = ["bellman_ford", "single_source_bellman_ford"]
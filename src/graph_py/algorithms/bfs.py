@@ -1,33 +1,171 @@
 from collections import deque
-from typing import Optional, List
+from typing import Callable, Dict, Hashable, Iterable, Optional, List, Sequence, Tuple, Union
 
 from ..core import Graph, Node
+from ..graphs.csr import CSRGraph
 
 
-def bfs(graph: Graph, src_node: Node, trg_node: Node) -> Optional[List[Node]]:
-    """Run breadth-first search and return the shortest path as nodes."""
+def bfs(
+    graph: Union[Graph, CSRGraph],
+    src_node: Node,
+    trg_node: Node,
+    *,
+    bidirectional: bool = False,
+) -> Optional[List[Node]]:
+    """Run breadth-first search and return the shortest path as nodes.
+
+    With ``bidirectional=True`` frontiers grow from both endpoints (the
+    target side following edges backwards) and meet in the middle, which
+    explores far fewer vertices on graphs with a high branching factor.
+    """
     assert (
-        src_node in graph.nodes and trg_node in graph.nodes
+        src_node in graph and trg_node in graph
     ), "target and source node need to be in the same graph"
 
     if src_node.id == trg_node.id:
         return [src_node]
 
+    if bidirectional:
+        if isinstance(graph, CSRGraph):
+            reverse = graph.reverse()
+            path = _bidirectional_bfs(
+                _csr_neighbors(graph),
+                _csr_neighbors(reverse),
+                graph.index[src_node.id],
+                graph.index[trg_node.id],
+            )
+            return None if path is None else graph.path_nodes(path)
+        adjacency, reverse_adjacency = graph.adjacency, graph.reverse_adjacency
+        path_ids = _bidirectional_bfs(
+            lambda node_id: adjacency.get(node_id, ()),
+            lambda node_id: reverse_adjacency.get(node_id, ()),
+            src_node.id,
+            trg_node.id,
+        )
+        return None if path_ids is None else [graph.get_node(node_id) for node_id in path_ids]
+
+    if isinstance(graph, CSRGraph):
+        path = _bfs_indices(graph.indptr, graph.indices, graph.index[src_node.id], graph.index[trg_node.id])
+        return None if path is None else graph.path_nodes(path)
+
     adjacency = graph.adjacency
-    id_to_node = {node.id: node for node in graph.nodes}
 
-    visited = {src_node.id}
-    queue = deque([(src_node.id, [src_node.id])])
+    previous: Dict[str, Optional[str]] = {src_node.id: None}
+    queue = deque([src_node.id])
 
     while queue:
-        current_id, path = queue.popleft()
+        current_id = queue.popleft()
         for neighbor_id in adjacency.get(current_id, []):
-            if neighbor_id in visited:
+            if neighbor_id in previous:
                 continue
-            visited.add(neighbor_id)
-            next_path = path + [neighbor_id]
+            previous[neighbor_id] = current_id
             if neighbor_id == trg_node.id:
-                return [id_to_node[node_id] for node_id in next_path]
-            queue.append((neighbor_id, next_path))
+                return _trace_path(graph, previous, neighbor_id)
+            queue.append(neighbor_id)
+
+    return None
+
+
+def _trace_path(graph: Graph, previous: Dict[str, Optional[str]], target_id: str) -> List[Node]:
+    """Follow predecessor links back from target_id and return the path as nodes."""
+    path_ids: List[str] = []
+    current_id: Optional[str] = target_id
+    while current_id is not None:
+        path_ids.append(current_id)
+        current_id = previous[current_id]
+    path_ids.reverse()
+    return [graph.get_node(node_id) for node_id in path_ids]
+
+
+def _bfs_indices(indptr: Sequence[int], indices: Sequence[int], source: int, target: int) -> Optional[List[int]]:
+    """BFS over CSR buffers, returning the path as node indices."""
+    previous = [-1] * (len(indptr) - 1)
+    previous[source] = source
+    queue = deque([source])
+
+    while queue:
+        current = queue.popleft()
+        for k in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[k]
+            if previous[neighbor] != -1:
+                continue
+            previous[neighbor] = current
+            if neighbor == target:
+                path = [target]
+                while path[-1] != source:
+                    path.append(previous[path[-1]])
+                path.reverse()
+                return path
+            queue.append(neighbor)
+
+    return None
+
+
+def _csr_neighbors(graph: CSRGraph) -> Callable[[int], Sequence[int]]:
+    indptr, indices = graph.indptr, graph.indices
+    return lambda node: indices[indptr[node]:indptr[node + 1]]
+
+
+def _bidirectional_bfs(
+    forward: Callable[[Hashable], Iterable[Hashable]],
+    backward: Callable[[Hashable], Iterable[Hashable]],
+    source: Hashable,
+    target: Hashable,
+) -> Optional[List[Hashable]]:
+    """Level-synchronous BFS from both ends, always expanding the smaller frontier.
+
+    A whole level is expanded before stopping so the cheapest meeting edge
+    found in it yields a shortest path.
+    """
+    forward_parent: Dict[Hashable, Optional[Hashable]] = {source: None}
+    backward_parent: Dict[Hashable, Optional[Hashable]] = {target: None}
+    forward_depth: Dict[Hashable, int] = {source: 0}
+    backward_depth: Dict[Hashable, int] = {target: 0}
+    forward_frontier = [source]
+    backward_frontier = [target]
+
+    while forward_frontier and backward_frontier:
+        best: Optional[Tuple[int, Hashable, Hashable]] = None
+        next_frontier = []
+        if len(forward_frontier) <= len(backward_frontier):
+            for current in forward_frontier:
+                depth = forward_depth[current] + 1
+                for neighbor in forward(current):
+                    if neighbor in backward_depth:
+                        total = depth + backward_depth[neighbor]
+                        if best is None or total < best[0]:
+                            best = (total, current, neighbor)
+                    if neighbor not in forward_parent:
+                        forward_parent[neighbor] = current
+                        forward_depth[neighbor] = depth
+                        next_frontier.append(neighbor)
+            forward_frontier = next_frontier
+        else:
+            for current in backward_frontier:
+                depth = backward_depth[current] + 1
+                for neighbor in backward(current):
+                    if neighbor in forward_depth:
+                        total = depth + forward_depth[neighbor]
+                        if best is None or total < best[0]:
+                            best = (total, neighbor, current)
+                    if neighbor not in backward_parent:
+                        backward_parent[neighbor] = current
+                        backward_depth[neighbor] = depth
+                        next_frontier.append(neighbor)
+            backward_frontier = next_frontier
+
+        if best is not None:
+            _, tail, head = best
+            path: List[Hashable] = []
+            node: Optional[Hashable] = tail
+            while node is not None:
+                path.append(node)
+                node = forward_parent[node]
+            path.reverse()
+            node = head
+            while node is not None:
+                path.append(node)
+                node = backward_parent[node]
+            return path
 
     return None
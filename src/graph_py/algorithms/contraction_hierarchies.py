@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import json
+from array import array
+from heapq import heappop, heappush
+from math import inf
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
+
+from ..core import Graph, Node
+from ..graphs.csr import CSRGraph
+
+_MAGIC = b"GRAPHPY-CH 1\n"
+_ARRAYS = (
+    ("rank", "q"),
+    ("up_indptr", "q"),
+    ("up_indices", "q"),
+    ("up_weights", "d"),
+    ("up_middle", "q"),
+    ("down_indptr", "q"),
+    ("down_indices", "q"),
+    ("down_weights", "d"),
+    ("down_middle", "q"),
+)
+
+
+class ContractionHierarchy:
+    """Contraction hierarchy over a static, non-negatively weighted graph.
+
+    ``build`` contracts nodes in edge-difference order, inserting shortcuts
+    that preserve shortest-path distances. Queries run a bidirectional
+    Dijkstra that only climbs the hierarchy (``up`` edges forwards, ``down``
+    edges backwards) and unpack shortcuts into original edges, returning
+    the same kind of ``List[Node]`` paths as ``dijkstra``.
+
+    Each search graph is stored in CSR form; ``*_middle`` holds the
+    contracted node a shortcut bypasses, or -1 for original edges.
+    """
+
+    __slots__ = ("node_ids", "nodes", "index") + tuple(name for name, _ in _ARRAYS)
+
+    def __init__(self, node_ids: Sequence[str], nodes: Sequence[Node], **arrays: array) -> None:
+        self.node_ids = list(node_ids)
+        self.nodes = tuple(nodes)
+        self.index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        for name, _ in _ARRAYS:
+            setattr(self, name, arrays[name])
+
+    @classmethod
+    def build(
+        cls,
+        graph: Union[Graph, CSRGraph],
+        *,
+        witness_settle_limit: int = 64,
+    ) -> ContractionHierarchy:
+        """Contract every node of graph.
+
+        Witness searches give up after settling ``witness_settle_limit``
+        nodes; a missed witness only costs a redundant shortcut.
+        """
+        csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+        node_count = len(csr)
+        out_adj: List[Dict[int, float]] = [{} for _ in range(node_count)]
+        in_adj: List[Dict[int, float]] = [{} for _ in range(node_count)]
+        middle: Dict[Tuple[int, int], int] = {}
+        for source in range(node_count):
+            for k in range(csr.indptr[source], csr.indptr[source + 1]):
+                target, weight = csr.indices[k], csr.weights[k]
+                if weight < 0:
+                    raise ValueError("Contraction hierarchies require non-negative edge weights")
+                if target != source and weight < out_adj[source].get(target, inf):
+                    out_adj[source][target] = weight
+                    in_adj[target][source] = weight
+
+        contractor = _Contractor(out_adj, in_adj, witness_settle_limit)
+        deleted_neighbors = [0] * node_count
+        heap = [(contractor.priority(v, 0), v) for v in range(node_count)]
+        heap.sort()
+
+        rank = array("q", bytes(8 * node_count))
+        up: List[List[Tuple[int, float, int]]] = [[] for _ in range(node_count)]
+        down: List[List[Tuple[int, float, int]]] = [[] for _ in range(node_count)]
+        order = 0
+        while heap:
+            _, v = heappop(heap)
+            priority = contractor.priority(v, deleted_neighbors[v])
+            if heap and priority > heap[0][0]:
+                heappush(heap, (priority, v))
+                continue
+
+            rank[v] = order
+            order += 1
+            up[v] = [(w, weight, middle.get((v, w), -1)) for w, weight in out_adj[v].items()]
+            down[v] = [(u, weight, middle.get((u, v), -1)) for u, weight in in_adj[v].items()]
+
+            for u, w, weight in contractor.shortcuts(v):
+                if weight < out_adj[u].get(w, inf):
+                    out_adj[u][w] = weight
+                    in_adj[w][u] = weight
+                    middle[(u, w)] = v
+            for w in out_adj[v]:
+                del in_adj[w][v]
+                deleted_neighbors[w] += 1
+            for u in in_adj[v]:
+                del out_adj[u][v]
+                deleted_neighbors[u] += 1
+            out_adj[v] = {}
+            in_adj[v] = {}
+
+        arrays = {"rank": rank}
+        for prefix, lists in (("up", up), ("down", down)):
+            indptr, indices, weights, middles = array("q", [0]), array("q"), array("d"), array("q")
+            for entries in lists:
+                for neighbor, weight, via in entries:
+                    indices.append(neighbor)
+                    weights.append(weight)
+                    middles.append(via)
+                indptr.append(len(indices))
+            arrays.update(
+                {
+                    f"{prefix}_indptr": indptr,
+                    f"{prefix}_indices": indices,
+                    f"{prefix}_weights": weights,
+                    f"{prefix}_middle": middles,
+                }
+            )
+        return cls(csr.node_ids, csr.nodes, **arrays)
+
+    @property
+    def shortcut_count(self) -> int:
+        return sum(1 for via in self.up_middle if via != -1) + sum(1 for via in self.down_middle if via != -1)
+
+    def shortest_path(self, src_node: Node, trg_node: Node) -> Optional[List[Node]]:
+        """Shortest path between two nodes of the contracted graph."""
+        assert (
+            src_node.id in self.index and trg_node.id in self.index
+        ), "target and source node need to be in the contracted graph"
+
+        path = self._query(self.index[src_node.id], self.index[trg_node.id])[1]
+        return None if path is None else [self.nodes[i] for i in path]
+
+    def distance(self, src_node: Node, trg_node: Node) -> float:
+        """Shortest-path distance (``inf`` when unreachable)."""
+        return self._query(self.index[src_node.id], self.index[trg_node.id], unpack=False)[0]
+
+    def save(self, file: Union[str, BinaryIO]) -> None:
+        """Serialize to a path or binary file object."""
+        if isinstance(file, str):
+            with open(file, "wb") as handle:
+                self.save(handle)
+            return
+        header = {"node_ids": self.node_ids, "lengths": {name: len(getattr(self, name)) for name, _ in _ARRAYS}}
+        file.write(_MAGIC)
+        file.write(json.dumps(header).encode("utf-8") + b"\n")
+        for name, _ in _ARRAYS:
+            file.write(getattr(self, name).tobytes())
+
+    @classmethod
+    def load(cls, file: Union[str, BinaryIO], graph: Union[Graph, CSRGraph]) -> ContractionHierarchy:
+        """Read a hierarchy written by ``save``, resolving nodes through graph."""
+        if isinstance(file, str):
+            with open(file, "rb") as handle:
+                return cls.load(handle, graph)
+        if file.readline() != _MAGIC:
+            raise ValueError("Not a graph-py contraction hierarchy")
+        header = json.loads(file.readline().decode("utf-8"))
+        arrays = {}
+        for name, typecode in _ARRAYS:
+            values = array(typecode)
+            count = header["lengths"][name]
+            values.frombytes(file.read(count * values.itemsize))
+            if len(values) != count:
+                raise ValueError("Truncated contraction hierarchy")
+            arrays[name] = values
+        nodes = []
+        for node_id in header["node_ids"]:
+            node = graph.get_node(node_id)
+            if node is None:
+                raise ValueError(f"Node '{node_id}' of the hierarchy is missing from graph '{graph.id}'")
+            nodes.append(node)
+        return cls(header["node_ids"], nodes, **arrays)
+
+    def _query(self, source: int, target: int, unpack: bool = True) -> Tuple[float, Optional[List[int]]]:
+        if source == target:
+            return 0.0, [source]
+
+        searches = (
+            (self.up_indptr, self.up_indices, self.up_weights),
+            (self.down_indptr, self.down_indices, self.down_weights),
+        )
+        distances: Tuple[Dict[int, float], ...] = ({source: 0.0}, {target: 0.0})
+        previous: Tuple[Dict[int, int], ...] = ({source: -1}, {target: -1})
+        heaps: Tuple[List[Tuple[float, int]], ...] = ([(0.0, source)], [(0.0, target)])
+        best, meeting = inf, -1
+
+        while heaps[0] or heaps[1]:
+            for side in (0, 1):
+                heap = heaps[side]
+                if not heap:
+                    continue
+                if heap[0][0] >= best:
+                    heap.clear()
+                    continue
+                current_distance, current = heappop(heap)
+                own, other = distances[side], distances[1 - side]
+                if current_distance > own[current]:
+                    continue
+                if current in other and current_distance + other[current] < best:
+                    best, meeting = current_distance + other[current], current
+                indptr, indices, weights = searches[side]
+                for k in range(indptr[current], indptr[current + 1]):
+                    neighbor = indices[k]
+                    candidate = current_distance + weights[k]
+                    if candidate < own.get(neighbor, inf):
+                        own[neighbor] = candidate
+                        previous[side][neighbor] = current
+                        heappush(heap, (candidate, neighbor))
+
+        if meeting == -1:
+            return inf, None
+        if not unpack:
+            return best, None
+
+        hops = [meeting]
+        while previous[0][hops[-1]] != -1:
+            hops.append(previous[0][hops[-1]])
+        hops.reverse()
+        node = previous[1][meeting]
+        while node != -1:
+            hops.append(node)
+            node = previous[1][node]
+
+        path = [hops[0]]
+        for tail, head in zip(hops, hops[1:]):
+            stack = [(tail, head)]
+            while stack:
+                a, b = stack.pop()
+                via = self._middle(a, b)
+                if via == -1:
+                    path.append(b)
+                else:
+                    stack.append((via, b))
+                    stack.append((a, via))
+        return best, path
+
+    def _middle(self, a: int, b: int) -> int:
+        """Node bypassed by the hierarchy edge a -> b, or -1 for an original edge."""
+        if self.rank[a] < self.rank[b]:
+            indptr, indices, middles, owner, other = self.up_indptr, self.up_indices, self.up_middle, a, b
+        else:
+            indptr, indices, middles, owner, other = self.down_indptr, self.down_indices, self.down_middle, b, a
+        for k in range(indptr[owner], indptr[owner + 1]):
+            if indices[k] == other:
+                return middles[k]
+        raise KeyError(f"No hierarchy edge between node indices {a} and {b}")
+
+
+class _Contractor:
+    """Shortcut simulation shared by node ordering and contraction."""
+
+    def __init__(self, out_adj: List[Dict[int, float]], in_adj: List[Dict[int, float]], settle_limit: int) -> None:
+        self.out_adj = out_adj
+        self.in_adj = in_adj
+        self.settle_limit = settle_limit
+
+    def priority(self, v: int, deleted_neighbors: int) -> int:
+        """Edge difference plus the number of already contracted neighbours."""
+        removed = len(self.out_adj[v]) + len(self.in_adj[v])
+        return len(self.shortcuts(v)) - removed + deleted_neighbors
+
+    def shortcuts(self, v: int) -> List[Tuple[int, int, float]]:
+        """Shortcuts ``(u, w, weight)`` needed to contract v."""
+        needed: List[Tuple[int, int, float]] = []
+        outgoing = self.out_adj[v]
+        if not outgoing:
+            return needed
+        max_out = max(outgoing.values())
+        for u, weight_in in self.in_adj[v].items():
+            witnesses = self._witness_search(u, v, weight_in + max_out)
+            for w, weight_out in outgoing.items():
+                if w == u:
+                    continue
+                via = weight_in + weight_out
+                if witnesses.get(w, inf) > via:
+                    needed.append((u, w, via))
+        return needed
+
+    def _witness_search(self, source: int, avoid: int, limit: float) -> Dict[int, float]:
+        distances = {source: 0.0}
+        heap = [(0.0, source)]
+        settled = 0
+        out_adj = self.out_adj
+        while heap:
+            current_distance, current = heappop(heap)
+            if current_distance > distances[current]:
+                continue
+            if current_distance > limit:
+                break
+            settled += 1
+            if settled > self.settle_limit:
+                break
+            for neighbor, weight in out_adj[current].items():
+                if neighbor == avoid:
+                    continue
+                candidate = current_distance + weight
+                if candidate < distances.get(neighbor, inf):
+                    distances[neighbor] = candidate
+                    heappush(heap, (candidate, neighbor))
+        return distances
+
+
+__all__ = ["ContractionHierarchy"]
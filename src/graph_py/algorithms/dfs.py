@@ -1,35 +1,68 @@
-from typing import Optional, List
+from typing import Dict, Optional, List, Sequence, Tuple, Union
 
 from ..core import Graph, Node
+from ..graphs.csr import CSRGraph
+from .bfs import _trace_path
 
 
-def dfs(graph: Graph, src_node: Node, trg_node: Node) -> Optional[List[Node]]:
+def dfs(graph: Union[Graph, CSRGraph], src_node: Node, trg_node: Node) -> Optional[List[Node]]:
     """Run depth-first search and return a path as nodes if reachable."""
     assert (
-        src_node in graph.nodes and trg_node in graph.nodes
+        src_node in graph and trg_node in graph
     ), "target and source node need to be in the same graph"
 
     if src_node.id == trg_node.id:
         return [src_node]
 
+    if isinstance(graph, CSRGraph):
+        path = _dfs_indices(graph.indptr, graph.indices, graph.index[src_node.id], graph.index[trg_node.id])
+        return None if path is None else graph.path_nodes(path)
+
     adjacency = graph.adjacency
-    id_to_node = {node.id: node for node in graph.nodes}
 
-    visited = set()
-    stack: List[tuple[str, List[str]]] = [(src_node.id, [src_node.id])]
+    previous: Dict[str, Optional[str]] = {}
+    stack: List[Tuple[str, Optional[str]]] = [(src_node.id, None)]
 
     while stack:
-        current_id, path = stack.pop()
-        if current_id in visited:
+        current_id, parent_id = stack.pop()
+        if current_id in previous:
             continue
-        visited.add(current_id)
+        previous[current_id] = parent_id
 
         if current_id == trg_node.id:
-            return [id_to_node[node_id] for node_id in path]
+            return _trace_path(graph, previous, current_id)
 
         for neighbor_id in reversed(adjacency.get(current_id, [])):
-            if neighbor_id in visited:
+            if neighbor_id in previous:
                 continue
-            stack.append((neighbor_id, path + [neighbor_id]))
+            stack.append((neighbor_id, current_id))
+
+    return None
+
+
+def _dfs_indices(indptr: Sequence[int], indices: Sequence[int], source: int, target: int) -> Optional[List[int]]:
+    """DFS over CSR buffers, returning the path as node indices."""
+    visited = bytearray(len(indptr) - 1)
+    previous = [-1] * (len(indptr) - 1)
+    stack = [(source, -1)]
+
+    while stack:
+        current, parent = stack.pop()
+        if visited[current]:
+            continue
+        visited[current] = 1
+        previous[current] = parent
+
+        if current == target:
+            path = [target]
+            while previous[path[-1]] != -1:
+                path.append(previous[path[-1]])
+            path.reverse()
+            return path
+
+        for k in range(indptr[current + 1] - 1, indptr[current] - 1, -1):
+            neighbor = indices[k]
+            if not visited[neighbor]:
+                stack.append((neighbor, current))
 
     return None
@@ -1,29 +1,66 @@
 from __future__ import annotations
 
+import asyncio
 from heapq import heappop, heappush
 from math import inf
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Generator, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
 
 from ..core import Graph, Node
+from ..graphs.csr import CSRGraph
+from .shortest_path_tree import ShortestPathTree
 
 
-def dijkstra(graph: Graph, src_node: Node, trg_node: Node) -> Optional[List[Node]]:
-    """Compute the shortest path between two nodes using Dijkstra's algorithm."""
+def dijkstra(
+    graph: Union[Graph, CSRGraph],
+    src_node: Node,
+    trg_node: Node,
+    *,
+    bidirectional: bool = False,
+) -> Optional[List[Node]]:
+    """Compute the shortest path between two nodes using Dijkstra's algorithm.
+
+    With ``bidirectional=True`` a forward search from the source and a
+    backward search from the target (over reversed edges) run in
+    alternation and stop once the two heap minima together reach the best
+    meeting distance found so far.
+    """
     assert (
-        src_node in graph.nodes and trg_node in graph.nodes
+        src_node in graph and trg_node in graph
     ), "target and source node need to be in the same graph"
 
     if src_node.id == trg_node.id:
         return [src_node]
 
-    adjacency = graph.adjacency
-    id_to_node = {node.id: node for node in graph.nodes}
+    if bidirectional:
+        if isinstance(graph, CSRGraph):
+            reverse = graph.reverse()
+            path = _bidirectional_dijkstra_indices(
+                (graph.indptr, reverse.indptr),
+                (graph.indices, reverse.indices),
+                (graph.weights, reverse.weights),
+                graph.index[src_node.id],
+                graph.index[trg_node.id],
+            )
+            return None if path is None else graph.path_nodes(path)
+        adjacency, reverse_adjacency = graph.weighted_adjacency, graph.weighted_reverse_adjacency
+        path_ids = _bidirectional_dijkstra(
+            lambda node_id: adjacency.get(node_id, ()),
+            lambda node_id: reverse_adjacency.get(node_id, ()),
+            src_node.id,
+            trg_node.id,
+        )
+        return None if path_ids is None else [graph.get_node(node_id) for node_id in path_ids]
+
+    if isinstance(graph, CSRGraph):
+        path = _dijkstra_indices(
+            graph.indptr, graph.indices, graph.weights, graph.index[src_node.id], graph.index[trg_node.id]
+        )
+        return None if path is None else graph.path_nodes(path)
 
-    weight_lookup = _build_weight_lookup(graph)
+    adjacency = graph.weighted_adjacency
 
-    distances: Dict[str, float] = {node.id: inf for node in graph.nodes}
-    previous: Dict[str, Optional[str]] = {node.id: None for node in graph.nodes}
-    distances[src_node.id] = 0.0
+    distances: Dict[str, float] = {src_node.id: 0.0}
+    previous: Dict[str, Optional[str]] = {src_node.id: None}
 
     heap: List[Tuple[float, str]] = [(0.0, src_node.id)]
 
@@ -35,18 +72,17 @@ def dijkstra(graph: Graph, src_node: Node, trg_node: Node) -> Optional[List[Node
         if current_id == trg_node.id:
             break
 
-        for neighbor_id in adjacency.get(current_id, []):
-            weight = _resolve_weight(weight_lookup, current_id, neighbor_id)
+        for neighbor_id, weight in adjacency.get(current_id, ()):
             if weight < 0:
                 raise ValueError("Dijkstra's algorithm requires non-negative edge weights")
 
             candidate_distance = current_distance + weight
-            if candidate_distance < distances[neighbor_id]:
+            if candidate_distance < distances.get(neighbor_id, inf):
                 distances[neighbor_id] = candidate_distance
                 previous[neighbor_id] = current_id
                 heappush(heap, (candidate_distance, neighbor_id))
 
-    if distances[trg_node.id] == inf:
+    if trg_node.id not in distances:
         return None
 
     path_ids = []
@@ -56,28 +92,370 @@ def dijkstra(graph: Graph, src_node: Node, trg_node: Node) -> Optional[List[Node
         current_id = previous[current_id]
     path_ids.reverse()
 
-    return [id_to_node[node_id] for node_id in path_ids]
+    return [graph.get_node(node_id) for node_id in path_ids]
+
+
+async def adijkstra(
+    graph: Union[Graph, CSRGraph],
+    src_node: Node,
+    trg_node: Node,
+    *,
+    yield_every: int = 1024,
+    timeout: Optional[float] = None,
+) -> Optional[List[Node]]:
+    """Event-loop friendly ``dijkstra``.
+
+    The search runs on the calling loop and hands control back every
+    ``yield_every`` expansions, so cancelling the awaiting task stops it at
+    the next yield. With ``timeout`` (seconds) it raises
+    ``asyncio.TimeoutError`` once the deadline passes.
+    """
+    if yield_every < 1:
+        raise ValueError(f"yield_every must be at least 1, got {yield_every}")
+    assert (
+        src_node in graph and trg_node in graph
+    ), "target and source node need to be in the same graph"
+
+    if src_node.id == trg_node.id:
+        return [src_node]
+
+    if isinstance(graph, CSRGraph):
+        indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+        steps = _dijkstra_steps(
+            lambda node: zip(indices[indptr[node]:indptr[node + 1]], weights[indptr[node]:indptr[node + 1]]),
+            graph.index[src_node.id],
+            graph.index[trg_node.id],
+            yield_every,
+        )
+        path = await _drive(steps, timeout)
+        return None if path is None else graph.path_nodes(path)
+
+    adjacency = graph.weighted_adjacency
+    steps = _dijkstra_steps(lambda node_id: adjacency.get(node_id, ()), src_node.id, trg_node.id, yield_every)
+    path_ids = await _drive(steps, timeout)
+    return None if path_ids is None else [graph.get_node(node_id) for node_id in path_ids]
+
+
+def _dijkstra_steps(
+    neighbors: Callable[[Hashable], Iterable[Tuple[Hashable, float]]],
+    source: Hashable,
+    target: Hashable,
+    yield_every: int,
+) -> Generator[None, None, Optional[List[Hashable]]]:
+    """Dijkstra as a generator that yields every ``yield_every`` expansions and returns the path."""
+    distances: Dict[Hashable, float] = {source: 0.0}
+    previous: Dict[Hashable, Optional[Hashable]] = {source: None}
+    heap: List[Tuple[float, Hashable]] = [(0.0, source)]
+    budget = yield_every
+
+    while heap:
+        current_distance, current = heappop(heap)
+        if current_distance > distances[current]:
+            continue
+
+        if current == target:
+            path: List[Hashable] = []
+            node: Optional[Hashable] = target
+            while node is not None:
+                path.append(node)
+                node = previous[node]
+            path.reverse()
+            return path
+
+        budget -= 1
+        if not budget:
+            budget = yield_every
+            yield
+
+        for neighbor, weight in neighbors(current):
+            if weight < 0:
+                raise ValueError("Dijkstra's algorithm requires non-negative edge weights")
+
+            candidate_distance = current_distance + weight
+            if candidate_distance < distances.get(neighbor, inf):
+                distances[neighbor] = candidate_distance
+                previous[neighbor] = current
+                heappush(heap, (candidate_distance, neighbor))
 
+    return None
 
-def _build_weight_lookup(graph: Graph) -> Dict[Tuple[str, str], float]:
-    lookup: Dict[Tuple[str, str], float] = {}
-    for edge in graph.edges:
-        weight = getattr(edge, "weight", 1.0)
+
+async def _drive(steps: Generator[None, None, Optional[list]], timeout: Optional[float]) -> Optional[list]:
+    """Run a step generator on the event loop, yielding to it between steps."""
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    while True:
         try:
-            lookup[(edge.source, edge.target)] = float(weight)
-        except (TypeError, ValueError):
-            lookup[(edge.source, edge.target)] = 1.0
-    return lookup
+            next(steps)
+        except StopIteration as finished:
+            return finished.value
+        if deadline is not None and loop.time() >= deadline:
+            steps.close()
+            raise asyncio.TimeoutError("Dijkstra search exceeded its deadline")
+        await asyncio.sleep(0)
+
+
+def single_source_dijkstra(
+    graph: Union[Graph, CSRGraph],
+    src_node: Node,
+    *,
+    cutoff: Optional[float] = None,
+    targets: Optional[Iterable[Node]] = None,
+) -> ShortestPathTree:
+    """Run Dijkstra from src_node and keep every distance and predecessor.
+
+    Nodes farther than ``cutoff`` are left out of the tree. With ``targets``
+    the search stops as soon as all of them are settled, so the tree holds
+    those targets plus whatever was settled before them.
+    """
+    assert src_node in graph, "source node needs to be in the graph"
+
+    target_ids = None if targets is None else {node.id for node in targets}
+    if isinstance(graph, CSRGraph):
+        indptr, indices, weights, node_ids = graph.indptr, graph.indices, graph.weights, graph.node_ids
+        distances, previous = _dijkstra_tree(
+            lambda node: zip(indices[indptr[node]:indptr[node + 1]], weights[indptr[node]:indptr[node + 1]]),
+            graph.index[src_node.id],
+            cutoff,
+            None if target_ids is None else {graph.index[node_id] for node_id in target_ids},
+        )
+        return ShortestPathTree(
+            graph,
+            src_node,
+            {node_ids[i]: distance for i, distance in distances.items()},
+            {node_ids[i]: None if previous[i] is None else node_ids[previous[i]] for i in distances},
+        )
+
+    adjacency = graph.weighted_adjacency
+    distances, previous = _dijkstra_tree(
+        lambda node_id: adjacency.get(node_id, ()), src_node.id, cutoff, target_ids
+    )
+    return ShortestPathTree(graph, src_node, distances, {node_id: previous[node_id] for node_id in distances})
+
+
+def _dijkstra_tree(
+    neighbors: Callable[[Hashable], Iterable[Tuple[Hashable, float]]],
+    source: Hashable,
+    cutoff: Optional[float],
+    targets: Optional[set],
+) -> Tuple[Dict[Hashable, float], Dict[Hashable, Optional[Hashable]]]:
+    """Settled distances and (possibly tentative) predecessors from source."""
+    limit = inf if cutoff is None else cutoff
+    remaining = None if targets is None else set(targets)
+    settled: Dict[Hashable, float] = {}
+    tentative: Dict[Hashable, float] = {source: 0.0}
+    previous: Dict[Hashable, Optional[Hashable]] = {source: None}
+    heap: List[Tuple[float, Hashable]] = [(0.0, source)]
+
+    while heap:
+        current_distance, current = heappop(heap)
+        if current in settled:
+            continue
+        settled[current] = current_distance
+
+        if remaining is not None:
+            remaining.discard(current)
+            if not remaining:
+                break
+
+        for neighbor, weight in neighbors(current):
+            if weight < 0:
+                raise ValueError("Dijkstra's algorithm requires non-negative edge weights")
+
+            candidate_distance = current_distance + weight
+            if candidate_distance <= limit and candidate_distance < tentative.get(neighbor, inf):
+                tentative[neighbor] = candidate_distance
+                previous[neighbor] = current
+                heappush(heap, (candidate_distance, neighbor))
+
+    return settled, previous
+
+
+def _dijkstra_indices(
+    indptr: Sequence[int],
+    indices: Sequence[int],
+    weights: Sequence[float],
+    source: int,
+    target: int,
+) -> Optional[List[int]]:
+    """Dijkstra over CSR buffers, returning the path as node indices."""
+    distances = [inf] * (len(indptr) - 1)
+    previous = [-1] * (len(indptr) - 1)
+    distances[source] = 0.0
+    heap: List[Tuple[float, int]] = [(0.0, source)]
+
+    while heap:
+        current_distance, current = heappop(heap)
+        if current_distance > distances[current]:
+            continue
 
+        if current == target:
+            break
+
+        for k in range(indptr[current], indptr[current + 1]):
+            weight = weights[k]
+            if weight < 0:
+                raise ValueError("Dijkstra's algorithm requires non-negative edge weights")
+
+            neighbor = indices[k]
+            candidate_distance = current_distance + weight
+            if candidate_distance < distances[neighbor]:
+                distances[neighbor] = candidate_distance
+                previous[neighbor] = current
+                heappush(heap, (candidate_distance, neighbor))
+
+    if distances[target] == inf:
+        return None
+
+    path = [target]
+    while previous[path[-1]] != -1:
+        path.append(previous[path[-1]])
+    path.reverse()
+    return path
+
+
+def _bidirectional_dijkstra(
+    forward: Callable[[Hashable], Iterable[Tuple[Hashable, float]]],
+    backward: Callable[[Hashable], Iterable[Tuple[Hashable, float]]],
+    source: Hashable,
+    target: Hashable,
+) -> Optional[List[Hashable]]:
+    """Bidirectional Dijkstra returning the path as a list of node keys."""
+    distances = ({source: 0.0}, {target: 0.0})
+    previous: Tuple[Dict[Hashable, Optional[Hashable]], ...] = ({source: None}, {target: None})
+    heaps: Tuple[List[Tuple[float, Hashable]], ...] = ([(0.0, source)], [(0.0, target)])
+    neighbors = (forward, backward)
+    best = inf
+    meeting: Optional[Hashable] = None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        own_distances, other_distances = distances[side], distances[1 - side]
+        current_distance, current = heappop(heaps[side])
+        if current_distance > own_distances[current]:
+            continue
+
+        for neighbor, weight in neighbors[side](current):
+            if weight < 0:
+                raise ValueError("Dijkstra's algorithm requires non-negative edge weights")
+
+            candidate_distance = current_distance + weight
+            if candidate_distance < own_distances.get(neighbor, inf):
+                own_distances[neighbor] = candidate_distance
+                previous[side][neighbor] = current
+                heappush(heaps[side], (candidate_distance, neighbor))
+
+            if neighbor in other_distances:
+                total = own_distances[neighbor] + other_distances[neighbor]
+                if total < best:
+                    best = total
+                    meeting = neighbor
+
+    if meeting is None:
+        return None
+
+    path: List[Hashable] = []
+    node: Optional[Hashable] = meeting
+    while node is not None:
+        path.append(node)
+        node = previous[0][node]
+    path.reverse()
+    node = previous[1][meeting]
+    while node is not None:
+        path.append(node)
+        node = previous[1][node]
+    return path
+
+
+def _dijkstra_distances(
+    indptr: Sequence[int],
+    indices: Sequence[int],
+    weights: Sequence[float],
+    source: int,
+) -> List[float]:
+    """Distances from source to every node index (``inf`` when unreachable)."""
+    distances = [inf] * (len(indptr) - 1)
+    distances[source] = 0.0
+    heap: List[Tuple[float, int]] = [(0.0, source)]
+
+    while heap:
+        current_distance, current = heappop(heap)
+        if current_distance > distances[current]:
+            continue
+        for k in range(indptr[current], indptr[current + 1]):
+            weight = weights[k]
+            if weight < 0:
+                raise ValueError("Dijkstra's algorithm requires non-negative edge weights")
+            neighbor = indices[k]
+            candidate_distance = current_distance + weight
+            if candidate_distance < distances[neighbor]:
+                distances[neighbor] = candidate_distance
+                heappush(heap, (candidate_distance, neighbor))
+
+    return distances
+
+
+def _bidirectional_dijkstra_indices(
+    indptrs: Tuple[Sequence[int], Sequence[int]],
+    indiceses: Tuple[Sequence[int], Sequence[int]],
+    weightses: Tuple[Sequence[float], Sequence[float]],
+    source: int,
+    target: int,
+) -> Optional[List[int]]:
+    """Bidirectional Dijkstra over forward and transposed CSR buffers."""
+    node_count = len(indptrs[0]) - 1
+    distances = ([inf] * node_count, [inf] * node_count)
+    previous = ([-1] * node_count, [-1] * node_count)
+    distances[0][source] = 0.0
+    distances[1][target] = 0.0
+    heaps: Tuple[List[Tuple[float, int]], ...] = ([(0.0, source)], [(0.0, target)])
+    best = inf
+    meeting = -1
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        own_distances, other_distances = distances[side], distances[1 - side]
+        own_previous, heap = previous[side], heaps[side]
+        indptr, indices, weights = indptrs[side], indiceses[side], weightses[side]
+        current_distance, current = heappop(heap)
+        if current_distance > own_distances[current]:
+            continue
+
+        for k in range(indptr[current], indptr[current + 1]):
+            weight = weights[k]
+            if weight < 0:
+                raise ValueError("Dijkstra's algorithm requires non-negative edge weights")
+
+            neighbor = indices[k]
+            candidate_distance = current_distance + weight
+            if candidate_distance < own_distances[neighbor]:
+                own_distances[neighbor] = candidate_distance
+                own_previous[neighbor] = current
+                heappush(heap, (candidate_distance, neighbor))
+
+            total = own_distances[neighbor] + other_distances[neighbor]
+            if total < best:
+                best = total
+                meeting = neighbor
+
+    if meeting == -1:
+        return None
 
-def _resolve_weight(
-    lookup: Dict[Tuple[str, str], float], source: str, target: str
-) -> float:
-    if (source, target) in lookup:
-        return lookup[(source, target)]
-    if (target, source) in lookup:
-        return lookup[(target, source)]
-    return 1.0
+    path = [meeting]
+    while previous[0][path[-1]] != -1:
+        path.append(previous[0][path[-1]])
+    path.reverse()
+    node = previous[1][meeting]
+    while node != -1:
+        path.append(node)
+        node = previous[1][node]
+    return path
 
 
-__all__ = ["dijkstra"]
+__all__ = ["adijkstra", "dijkstra", "single_source_dijkstra"]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional, Tuple, Union
+
+from ..core import Graph, NegativeCycleError, Node
+from ..graphs.csr import CSRGraph
+from .bellman_ford import _bellman_ford_tree_indices
+
+
+def floyd_warshall(
+    graph: Union[Graph, CSRGraph],
+    *,
+    dtype: str = "float64",
+    block: int = 64,
+) -> Tuple[Any, Any]:
+    """Dense all-pairs distances and predecessors with a blocked Floyd-Warshall.
+
+    Works on ``block x block`` tiles of the matrix from
+    ``to_adjacency_matrix``: per diagonal tile it closes the tile itself,
+    then its row and column panels, then relaxes every remaining tile with
+    a min-plus product against the panels, updating in place.
+    ``dtype="float32"`` halves the memory.
+
+    Paths are compared by distance, then by edge count. The tie-break keeps
+    predecessor chains acyclic when zero-weight edges make several paths
+    equally short, whatever order the tiles are updated in.
+
+    Returns ``(distances, predecessors)`` in ``to_csr().node_ids`` order;
+    ``predecessors[i, j]`` is the node before ``j`` on the path from ``i``
+    (-1 for none). Use ``predecessor_path`` to turn a row into nodes.
+    Raises ``NegativeCycleError`` when a negative cycle exists.
+    """
+    try:
+        import numpy as np
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError("floyd_warshall requires numpy") from exc
+
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    distances = csr.to_adjacency_matrix(dtype)
+    node_count = len(distances)
+    reachable = np.isfinite(distances)
+    predecessors = np.where(reachable, np.arange(node_count, dtype=np.int32)[:, None], -1).astype(np.int32)
+    # Edge counts; unreachable entries hold 0 so an inf candidate never wins a tie.
+    hops = reachable.astype(np.int16 if 2 * node_count < 2**15 else np.int32)
+    diagonal = np.arange(node_count)
+    closed = distances[diagonal, diagonal] >= 0
+    distances[diagonal[closed], diagonal[closed]] = 0
+    predecessors[diagonal[closed], diagonal[closed]] = -1
+    hops[diagonal[closed], diagonal[closed]] = 0
+
+    matrices = (distances, hops, predecessors)
+    tiles = [slice(start, min(start + block, node_count)) for start in range(0, node_count, block)]
+    for pivot in tiles:
+        _close_panel(matrices, pivot, pivot, pivot)
+        _close_panel(matrices, pivot, slice(0, node_count), pivot)
+        _close_panel(matrices, slice(0, node_count), pivot, pivot)
+        for rows in tiles:
+            if rows == pivot:
+                continue
+            for cols in tiles:
+                if cols != pivot:
+                    _min_plus_tile(matrices, rows, cols, pivot)
+
+    negative = np.flatnonzero(distances[diagonal, diagonal] < 0)
+    if negative.size:
+        # Matrices are meaningless once a negative cycle is involved; let
+        # Bellman-Ford from a node on it recover the cycle itself.
+        try:
+            _bellman_ford_tree_indices(csr.indptr, csr.indices, csr.weights, int(negative[0]))
+            cycle: List[int] = []
+        except NegativeCycleError as error:
+            cycle = error.cycle
+        raise NegativeCycleError("Floyd-Warshall algorithm detected a negative-weight cycle", csr.path_nodes(cycle))
+
+    return distances, predecessors
+
+
+def predecessor_path(
+    graph: Union[Graph, CSRGraph],
+    predecessors: Any,
+    src_node: Node,
+    trg_node: Node,
+) -> Optional[List[Node]]:
+    """Path from src_node to trg_node read off a ``floyd_warshall`` predecessor matrix.
+
+    Raises ValueError if the predecessors do not lead back to src_node.
+    """
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    source, target = csr.index[src_node.id], csr.index[trg_node.id]
+    if source == target:
+        return [src_node]
+
+    row = predecessors[source]
+    if row[target] == -1:
+        return None
+    path = [target]
+    while path[-1] != source:
+        if len(path) > len(csr) or row[path[-1]] == -1:
+            raise ValueError(f"Predecessor row of '{src_node.id}' does not lead back to it")
+        path.append(int(row[path[-1]]))
+    path.reverse()
+    return csr.path_nodes(path)
+
+
+def _close_panel(matrices: Tuple[Any, Any, Any], rows: slice, cols: slice, pivot: slice) -> None:
+    """Relax tile ``rows x cols`` through each pivot in turn (the tile may contain the pivots)."""
+    import numpy as np
+
+    distances, hops, predecessors = matrices
+    tile, tile_hops, tile_predecessors = distances[rows, cols], hops[rows, cols], predecessors[rows, cols]
+    for k in range(pivot.start, pivot.stop):
+        candidates = distances[rows, k, None] + distances[None, k, cols]
+        candidate_hops = hops[rows, k, None] + hops[None, k, cols]
+        improved = (candidates < tile) | ((candidates == tile) & (candidate_hops < tile_hops))
+        np.copyto(tile, candidates, where=improved)
+        np.copyto(tile_hops, candidate_hops, where=improved)
+        np.copyto(tile_predecessors, predecessors[None, k, cols], where=improved)
+
+
+def _min_plus_tile(matrices: Tuple[Any, Any, Any], rows: slice, cols: slice, pivot: slice) -> None:
+    """Relax tile ``rows x cols`` through all pivots at once; the pivot panels are already closed."""
+    import numpy as np
+
+    distances, hops, predecessors = matrices
+    through = distances[rows, pivot][:, :, None] + distances[None, pivot, cols]
+    candidates = through.min(axis=1)
+    through_hops = hops[rows, pivot][:, :, None] + hops[None, pivot, cols]
+    # Among the shortest candidates prefer the fewest edges.
+    through_hops = np.where(through == candidates[:, None, :], through_hops, np.iinfo(through_hops.dtype).max)
+    best = through_hops.argmin(axis=1)
+    candidate_hops = np.take_along_axis(through_hops, best[:, None, :], axis=1)[:, 0, :]
+
+    tile, tile_hops = distances[rows, cols], hops[rows, cols]
+    improved = (candidates < tile) | ((candidates == tile) & (candidate_hops < tile_hops))
+    if improved.any():
+        via = predecessors[pivot, cols][best, np.arange(tile.shape[1])]
+        np.copyto(tile, candidates, where=improved)
+        np.copyto(tile_hops, candidate_hops, where=improved)
+        np.copyto(predecessors[rows, cols], via, where=improved)
+
+
+__all__ = ["floyd_warshall", "predecessor_path"]
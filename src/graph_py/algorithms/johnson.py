@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Sequence, Union
+
+from ..core import Graph, NegativeCycleError
+from ..graphs.csr import CSRGraph
+from .bellman_ford import _bellman_ford_numpy, _bellman_ford_tree_indices, _spfa_tree
+from .dijkstra import _dijkstra_distances
+
+_BLOCK_ROWS = 256
+_worker_buffers: Optional[tuple] = None
+
+
+def johnson(
+    graph: Union[Graph, CSRGraph],
+    *,
+    method: str = "sweep",
+    workers: Optional[int] = None,
+    out: Optional[str] = None,
+) -> Any:
+    """All-pairs shortest distances with Johnson's algorithm.
+
+    One Bellman-Ford run (``method`` as in ``bellman_ford``) from a virtual
+    source yields potentials that make every edge weight non-negative, then
+    Dijkstra runs once per node over the reweighted CSR buffers. With
+    ``workers > 1`` the Dijkstra runs are spread over a process pool.
+
+    Returns a dense ``numpy`` float64 matrix whose rows and columns follow
+    ``graph.to_csr().node_ids`` (``inf`` when unreachable). Passing a path as
+    ``out`` writes the matrix to a ``.npy`` memory-mapped file instead of
+    keeping it in memory. Raises ``NegativeCycleError`` like ``bellman_ford``.
+    """
+    try:
+        import numpy as np
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError("johnson requires numpy") from exc
+
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    node_count = len(csr)
+    potentials = _potentials(csr, method)
+    reweighted = array("d", csr.weights)
+    for source in range(node_count):
+        for k in range(csr.indptr[source], csr.indptr[source + 1]):
+            # Clamp rounding noise so Dijkstra never sees a negative weight.
+            reweighted[k] = max(0.0, csr.weights[k] + potentials[source] - potentials[csr.indices[k]])
+
+    if out is None:
+        matrix = np.empty((node_count, node_count), dtype=np.float64)
+    else:
+        matrix = np.lib.format.open_memmap(out, mode="w+", dtype=np.float64, shape=(node_count, node_count))
+
+    heights = np.asarray(potentials, dtype=np.float64)
+    buffers = (csr.indptr, csr.indices, reweighted)
+    executor = None
+    if workers is None or workers <= 1:
+        chunks = _row_blocks(node_count, _BLOCK_ROWS)
+        results = (_distance_rows(buffers, chunk) for chunk in chunks)
+    else:
+        chunks = _row_blocks(node_count, min(_BLOCK_ROWS, max(1, -(-node_count // (workers * 4)))))
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=buffers)
+        results = executor.map(_johnson_rows, chunks)
+
+    try:
+        for chunk, rows in zip(chunks, results):
+            block = np.frombuffer(rows, dtype=np.float64).reshape(len(chunk), node_count)
+            matrix[chunk.start:chunk.stop] = block - heights[chunk.start:chunk.stop, None] + heights
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if out is not None:
+        matrix.flush()
+    return matrix
+
+
+def _potentials(csr: CSRGraph, method: str) -> List[float]:
+    """Bellman-Ford distances from a virtual source linked to every node by a 0 edge."""
+    node_count = len(csr)
+    indptr = array("q", csr.indptr)
+    indptr.append(indptr[-1] + node_count)
+    indices = array("q", csr.indices)
+    indices.extend(range(node_count))
+    weights = array("d", csr.weights)
+    weights.extend([0.0] * node_count)
+
+    try:
+        if method == "numpy":
+            import numpy as np
+
+            distances, _ = _bellman_ford_numpy(
+                np.frombuffer(indptr, dtype=np.int64),
+                np.frombuffer(indices, dtype=np.int64),
+                np.frombuffer(weights, dtype=np.float64),
+                node_count,
+            )
+            return distances.tolist()[:node_count]
+        if method == "spfa":
+            reached, _ = _spfa_tree(
+                lambda node: zip(indices[indptr[node]:indptr[node + 1]], weights[indptr[node]:indptr[node + 1]]),
+                node_count,
+                node_count + 1,
+            )
+            return [reached[i] for i in range(node_count)]
+        if method == "sweep":
+            return _bellman_ford_tree_indices(indptr, indices, weights, node_count)[0][:node_count]
+    except NegativeCycleError as error:
+        error.cycle = csr.path_nodes(error.cycle)
+        raise
+    raise ValueError(f"Unknown Bellman-Ford method '{method}'")
+
+
+def _row_blocks(node_count: int, size: int) -> List[range]:
+    return [range(start, min(start + size, node_count)) for start in range(0, node_count, size)]
+
+
+def _distance_rows(buffers: tuple, sources: range) -> bytes:
+    """Reweighted distance rows for a block of sources, as raw doubles."""
+    indptr, indices, weights = buffers
+    rows = array("d")
+    for source in sources:
+        rows.extend(_dijkstra_distances(indptr, indices, weights, source))
+    return rows.tobytes()
+
+
+def _init_worker(indptr: Sequence[int], indices: Sequence[int], weights: Sequence[float]) -> None:
+    global _worker_buffers
+    _worker_buffers = (indptr, indices, weights)
+
+
+def _johnson_rows(sources: range) -> bytes:
+    return _distance_rows(_worker_buffers, sources)
+
+
+__all__ = ["johnson"]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+from ..core import Graph, Node
+from ..graphs.csr import CSRGraph
+
+_BATCH = 64
+
+
+def multi_source_bfs(graph: Union[Graph, CSRGraph], sources: Sequence[Node]) -> List[array]:
+    """Hop distances from every source, one row per source.
+
+    Each row is an ``array('i')`` in ``to_csr().node_ids`` order holding the
+    number of edges on a shortest path from that source, -1 when unreachable.
+    See ``iter_multi_source_bfs`` for how sources are batched.
+    """
+    return [row for _, row in iter_multi_source_bfs(graph, sources)]
+
+
+def iter_multi_source_bfs(graph: Union[Graph, CSRGraph], sources: Sequence[Node]) -> Iterator[Tuple[Node, array]]:
+    """Yield ``(source, hops)`` rows, computed 64 sources at a time.
+
+    Every batch shares one traversal (MS-BFS): each node carries a bitset of
+    the sources that have seen it and one of the sources whose frontier it
+    is on, so an edge is scanned once per level for the whole batch instead
+    of once per source. With NumPy installed the bitsets are ``uint64``
+    arrays and each level is a handful of vectorized passes.
+    """
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    for source in sources:
+        assert source in csr, "source nodes need to be in the graph"
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        kernel, buffers = _ms_bfs_indices, (csr.indptr, csr.indices)
+    else:
+        kernel, buffers = _ms_bfs_numpy, csr.to_numpy()[:2]
+
+    for start in range(0, len(sources), _BATCH):
+        batch = sources[start:start + _BATCH]
+        rows = kernel(*buffers, [csr.index[node.id] for node in batch])
+        yield from zip(batch, rows)
+
+
+def _ms_bfs_indices(indptr: Sequence[int], indices: Sequence[int], sources: Sequence[int]) -> List[array]:
+    """Bit-parallel BFS from up to 64 source indices over CSR buffers."""
+    node_count = len(indptr) - 1
+    rows = [array("i", [-1]) * node_count for _ in sources]
+    seen = [0] * node_count
+    frontier: Dict[int, int] = {}
+    for bit, source in enumerate(sources):
+        rows[bit][source] = 0
+        seen[source] |= 1 << bit
+        frontier[source] = frontier.get(source, 0) | 1 << bit
+
+    level = 0
+    while frontier:
+        level += 1
+        next_frontier: Dict[int, int] = {}
+        pending = next_frontier.get
+        for current, visiting in frontier.items():
+            for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                fresh = visiting & ~seen[neighbor]
+                if fresh:
+                    seen[neighbor] |= fresh
+                    next_frontier[neighbor] = pending(neighbor, 0) | fresh
+
+        for node, bits in next_frontier.items():
+            while bits:
+                lowest = bits & -bits
+                rows[lowest.bit_length() - 1][node] = level
+                bits ^= lowest
+        frontier = next_frontier
+
+    return rows
+
+
+def _ms_bfs_numpy(indptr, indices, sources: Sequence[int]) -> List[array]:
+    """``_ms_bfs_indices`` over NumPy CSR arrays with ``uint64`` bitsets.
+
+    Per level the out-edges of the frontier are gathered from the CSR
+    ranges, the frontier bits are scattered onto their heads with
+    ``np.bitwise_or.at`` and already-seen bits are masked off; the new
+    bits are then peeled off lowest first into the hop rows.
+    """
+    import numpy as np
+
+    node_count = len(indptr) - 1
+    hops = np.full((node_count, len(sources)), -1, dtype=np.int32)
+    seen = np.zeros(node_count, dtype=np.uint64)
+    sources = np.asarray(sources, dtype=np.int64)
+    np.bitwise_or.at(seen, sources, np.uint64(1) << np.arange(len(sources), dtype=np.uint64))
+    hops[sources, np.arange(len(sources))] = 0
+    frontier = np.unique(sources)
+    visiting = seen[frontier]
+
+    level = 0
+    while frontier.size:
+        level += 1
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            break
+        edges = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+        reached = np.zeros(node_count, dtype=np.uint64)
+        np.bitwise_or.at(reached, indices[edges], np.repeat(visiting, counts))
+        reached &= ~seen
+        frontier = np.flatnonzero(reached)
+        visiting = reached[frontier]
+        seen[frontier] |= visiting
+
+        nodes, pending = frontier, visiting
+        while nodes.size:
+            lowest = pending & (~pending + np.uint64(1))
+            # log2 of a power of two is exact in float64, giving the bit index.
+            hops[nodes, np.log2(lowest).astype(np.intp)] = level
+            pending = pending ^ lowest
+            keep = pending != 0
+            nodes, pending = nodes[keep], pending[keep]
+
+    return [array("i", row.tobytes()) for row in hops.T]
+
+
+__all__ = ["multi_source_bfs", "iter_multi_source_bfs"]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Dict, Iterable, List, Optional, Type, TypeVar
 
-from ..core import Edge, Graph, Node
+from ..core import Edge, EdgeRecord, Graph, Node, NodeRecord
 
 GraphT = TypeVar("GraphT", bound=Graph)
 
@@ -16,11 +16,15 @@ def _dump_model(model, exclude: Optional[Iterable[str]] = None) -> dict:
 
 
 def _clone_node(node: Node) -> Node:
+    if isinstance(node, NodeRecord):
+        return node.copy()
     data = _dump_model(node, exclude={"graph"})
     return node.__class__(**data)
 
 
 def _clone_edge(edge: Edge) -> Edge:
+    if isinstance(edge, EdgeRecord):
+        return edge.copy()
     data = _dump_model(edge)
     return edge.__class__(**data)
 
@@ -43,13 +47,13 @@ def _build_graph(
     graph_name: Optional[str],
     nodes: List[Node],
     edges: List[Edge],
+    record_mode: str = "pydantic",
 ) -> GraphT:
-    graph = graph_cls(id=graph_id, name=graph_name, nodes=[], edges=[])  # type: ignore[call-arg]
-    for node in nodes:
-        graph.add_node(node)
-    for edge in edges:
-        if graph.get_node(edge.source) and graph.get_node(edge.target):
-            graph.add_edge(edge)
+    graph = graph_cls(id=graph_id, name=graph_name, nodes=[], edges=[], record_mode=record_mode)  # type: ignore[call-arg]
+    graph.add_nodes_from(nodes)
+    graph.add_edges_from(
+        edge for edge in edges if graph.get_node(edge.source) and graph.get_node(edge.target)
+    )
     return graph
 
 
@@ -74,6 +78,7 @@ def graph_union(graph_a: GraphT, graph_b: GraphT) -> GraphT:
         graph_name,
         list(nodes_seen.values()),
         list(edges_seen.values()),
+        graph_a.record_mode,
     )
 
 
@@ -100,7 +105,7 @@ def graph_intersection(graph_a: GraphT, graph_b: GraphT) -> GraphT:
 
     graph_id = f"{graph_a.id}_intersection_{graph_b.id}"
     graph_name = f"Intersection({graph_a.name or graph_a.id}, {graph_b.name or graph_b.id})"
-    return _build_graph(graph_cls, graph_id, graph_name, shared_nodes, shared_edges)
+    return _build_graph(graph_cls, graph_id, graph_name, shared_nodes, shared_edges, graph_a.record_mode)
 
 
 __all__ = ["graph_union", "graph_intersection"]
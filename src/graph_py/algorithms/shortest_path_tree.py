@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from math import inf
+from typing import Dict, Iterator, List, Optional, Union
+
+from ..core import Graph, Node
+from ..graphs.csr import CSRGraph
+
+
+class ShortestPathTree:
+    """Distances and predecessors from a single source node.
+
+    Returned by ``single_source_dijkstra`` and ``single_source_bellman_ford``.
+    ``distances`` and ``previous`` are keyed by node id and only cover the
+    nodes the search settled; distance lookups are dictionary hits and
+    paths are rebuilt on demand by following predecessors.
+    """
+
+    __slots__ = ("graph", "source", "distances", "previous")
+
+    def __init__(
+        self,
+        graph: Union[Graph, CSRGraph],
+        source: Node,
+        distances: Dict[str, float],
+        previous: Dict[str, Optional[str]],
+    ) -> None:
+        self.graph = graph
+        self.source = source
+        self.distances = distances
+        self.previous = previous
+
+    def __len__(self) -> int:
+        return len(self.distances)
+
+    def __contains__(self, node: Node) -> bool:
+        return node.id in self.distances
+
+    def __iter__(self) -> Iterator[Node]:
+        """Reached nodes in the order they were settled."""
+        return (self.graph.get_node(node_id) for node_id in self.distances)
+
+    def distance(self, node: Node) -> float:
+        """Shortest distance from the source (``inf`` when not reached)."""
+        return self.distances.get(node.id, inf)
+
+    def predecessor(self, node: Node) -> Optional[Node]:
+        """Node preceding node on its shortest path, ``None`` for the source or unreached nodes."""
+        previous_id = self.previous.get(node.id) if node.id in self.distances else None
+        return None if previous_id is None else self.graph.get_node(previous_id)
+
+    def path_to(self, node: Node) -> Optional[List[Node]]:
+        """Shortest path from the source to node, or ``None`` when not reached."""
+        if node.id not in self.distances:
+            return None
+
+        path_ids: List[str] = []
+        current_id: Optional[str] = node.id
+        while current_id is not None:
+            path_ids.append(current_id)
+            current_id = self.previous[current_id]
+        path_ids.reverse()
+        return [self.graph.get_node(node_id) for node_id in path_ids]
+
+
+__all__ = ["ShortestPathTree"]
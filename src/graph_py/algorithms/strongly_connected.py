@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from array import array
+from typing import List, Sequence, Tuple, Union
+
+from ..core import Edge, Graph, Node
+from ..graphs.csr import CSRGraph
+from ..graphs.directed import DirectedGraph
+
+
+class StronglyConnectedComponents:
+    """Component labels and condensation DAG of a graph.
+
+    ``labels[i]`` is the component of node ``node_ids[i]``. Components are
+    numbered in topological order of the condensation, so every DAG edge
+    ``dag_indices[dag_indptr[c]:dag_indptr[c + 1]]`` leads from ``c`` to a
+    higher-numbered component.
+    """
+
+    __slots__ = ("node_ids", "index", "labels", "count", "dag_indptr", "dag_indices")
+
+    def __init__(
+        self,
+        node_ids: Sequence[str],
+        index: dict,
+        labels: array,
+        count: int,
+        dag_indptr: array,
+        dag_indices: array,
+    ) -> None:
+        self.node_ids = node_ids
+        self.index = index
+        self.labels = labels
+        self.count = count
+        self.dag_indptr = dag_indptr
+        self.dag_indices = dag_indices
+
+    def __len__(self) -> int:
+        return self.count
+
+    def component_of(self, node: Node) -> int:
+        return self.labels[self.index[node.id]]
+
+    def same_component(self, node_a: Node, node_b: Node) -> bool:
+        """Whether each node can reach the other."""
+        return self.component_of(node_a) == self.component_of(node_b)
+
+    def components(self) -> List[List[str]]:
+        """Node ids of every component, by component number."""
+        members: List[List[str]] = [[] for _ in range(self.count)]
+        for node_id, label in zip(self.node_ids, self.labels):
+            members[label].append(node_id)
+        return members
+
+    def condensation(self) -> DirectedGraph:
+        """The condensation DAG as a graph with one node per component (ids ``"0"``, ``"1"``, ...)."""
+        graph = DirectedGraph(id="condensation")
+        graph.add_nodes_from(str(c) for c in range(self.count))
+        graph.add_edges_from(
+            Edge(id=f"{c}->{d}", source=str(c), target=str(d))
+            for c in range(self.count)
+            for d in self.dag_indices[self.dag_indptr[c]:self.dag_indptr[c + 1]]
+        )
+        return graph
+
+
+def strongly_connected_components(graph: Union[Graph, CSRGraph]) -> StronglyConnectedComponents:
+    """Strongly connected components with an iterative Tarjan search over the CSR snapshot.
+
+    Uses an explicit stack instead of recursion, so arbitrarily long paths
+    are fine. On symmetric graphs the components are the connected ones.
+    """
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    labels, count = _tarjan_indices(csr.indptr, csr.indices)
+    dag_indptr, dag_indices = _condense(csr.indptr, csr.indices, labels, count)
+    return StronglyConnectedComponents(csr.node_ids, csr.index, labels, count, dag_indptr, dag_indices)
+
+
+def _tarjan_indices(indptr: Sequence[int], indices: Sequence[int]) -> Tuple[array, int]:
+    """Component label per node index, numbered in topological order, and the component count."""
+    node_count = len(indptr) - 1
+    order = [-1] * node_count
+    low = [0] * node_count
+    on_stack = bytearray(node_count)
+    labels = array("q", [-1]) * node_count
+    stack: List[int] = []
+    counter = 0
+    found = 0
+
+    for root in range(node_count):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, indptr[root])]
+
+        while work:
+            current, k = work[-1]
+            end = indptr[current + 1]
+            while k < end:
+                neighbor = indices[k]
+                k += 1
+                if order[neighbor] == -1:
+                    work[-1] = (current, k)
+                    order[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    work.append((neighbor, indptr[neighbor]))
+                    break
+                if on_stack[neighbor] and order[neighbor] < low[current]:
+                    low[current] = order[neighbor]
+            else:
+                work.pop()
+                if low[current] == order[current]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        labels[member] = found
+                        if member == current:
+                            break
+                    found += 1
+                if work:
+                    parent = work[-1][0]
+                    if low[current] < low[parent]:
+                        low[parent] = low[current]
+
+    # Tarjan completes components in reverse topological order.
+    last = found - 1
+    for i in range(node_count):
+        labels[i] = last - labels[i]
+    return labels, found
+
+
+def _condense(indptr: Sequence[int], indices: Sequence[int], labels: array, count: int) -> Tuple[array, array]:
+    """Deduplicated CSR adjacency between components."""
+    successors: List[set] = [set() for _ in range(count)]
+    for source in range(len(indptr) - 1):
+        label = labels[source]
+        targets = successors[label]
+        for k in range(indptr[source], indptr[source + 1]):
+            target_label = labels[indices[k]]
+            if target_label != label:
+                targets.add(target_label)
+
+    dag_indptr = array("q", [0])
+    dag_indices = array("q")
+    for targets in successors:
+        dag_indices.extend(sorted(targets))
+        dag_indptr.append(len(dag_indices))
+    return dag_indptr, dag_indices
+
+
+__all__ = ["StronglyConnectedComponents", "strongly_connected_components"]
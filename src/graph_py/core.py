@@ -1,11 +1,17 @@
 from __future__ import annotations
+import asyncio
+import gc
 import re
+from contextlib import contextmanager
+from functools import partial
 from abc import ABC, abstractmethod
-from typing import Optional, List, TYPE_CHECKING, Any, Sequence, Dict, Union
-from pydantic import BaseModel, Field, PrivateAttr
+from concurrent.futures import Executor
+from typing import Optional, List, TYPE_CHECKING, Any, Callable, ClassVar, Iterable, Iterator, Literal, Mapping, Sequence, Dict, Type, Union
+from pydantic import BaseModel, Field, PrivateAttr, SerializerFunctionWrapHandler, field_serializer
 
 if TYPE_CHECKING:
     from uuid import UUID
+    from .graphs.csr import CSRGraph
 
 
 class SearchError(RuntimeError):
@@ -15,13 +21,54 @@ class SearchError(RuntimeError):
 class UnknownStrategyError(LookupError):
     """Raised when a requested search strategy is not registered."""
 
+
+class NegativeCycleError(ValueError):
+    """Raised when a shortest-path search reaches a negative-weight cycle.
+
+    ``cycle`` lists the nodes of one such cycle in edge order (empty when
+    it could not be recovered).
+    """
+
+    def __init__(self, message: str, cycle: Optional[List[Node]] = None) -> None:
+        super().__init__(message)
+        self.cycle = [] if cycle is None else cycle
+
+
 class Edge(BaseModel):
-    """Base class for all edge types."""
+    """Base class for all edge types.
+
+    Assigning ``weight`` on an edge type that has one drops the cached
+    weighted views (``weighted_adjacency``, ``to_csr``, ...) of the graphs
+    holding the edge, which it tracks outside its pydantic fields.
+    """
+    __slots__ = ("_indexes",)
     id: str
     name: Optional[str] = None
     source: str
     target: str
 
+    def model_post_init(self, context: Any) -> None:
+        object.__setattr__(self, "_indexes", [])
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "weight":
+            for index in getattr(self, "_indexes", ()):
+                index.weights_version += 1
+
+    def _attach(self, index: _GraphIndex) -> None:
+        try:
+            self._indexes.append(index)
+        except AttributeError:  # copies skip model_post_init
+            object.__setattr__(self, "_indexes", [index])
+
+    def _detach(self, index: _GraphIndex) -> None:
+        self._indexes.remove(index)
+
+class WeightedEdge(Edge):
+    """Edge carrying a numeric weight used by the shortest-path algorithms."""
+    weight: float = 1.0
+
 class Node(BaseModel):
     """Base class for all nodes."""
     id: str
@@ -33,15 +80,23 @@ class Node(BaseModel):
         """View: edges connected to this node."""
         if not self.graph:
             return []
-        return [e for e in self.graph.edges if e.source == self.id or e.target == self.id]
+        outgoing = self.graph.out_edges(self.id)
+        incoming = [e for e in self.graph.in_edges(self.id) if e.source != self.id]
+        return outgoing + incoming
 
     @property
     def neighbors(self) -> List[Node]:
         """View: connected nodes."""
         if not self.graph:
             return []
-        neighbor_ids = {e.target if e.source == self.id else e.source for e in self.edges}
-        return [n for n in self.graph.nodes if n.id in neighbor_ids]
+        neighbors: Dict[str, Node] = {}
+        for e in self.edges:
+            neighbor_id = e.target if e.source == self.id else e.source
+            if neighbor_id not in neighbors:
+                node = self.graph.get_node(neighbor_id)
+                if node is not None:
+                    neighbors[neighbor_id] = node
+        return list(neighbors.values())
 
 class PropertyNode(Node):
     """Node subclass that stores arbitrary key/value properties."""
@@ -55,6 +110,111 @@ class PropertyNode(Node):
         """Retrieve a property value, returning default when missing."""
         return self.properties.get(key, default)
 
+class _Record:
+    """Shared behaviour of the slotted node/edge records."""
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that are not slots: fall back to extra fields.
+        try:
+            attrs = object.__getattribute__(self, "attrs")
+        except AttributeError:
+            attrs = None
+        if attrs and name in attrs:
+            return attrs[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.model_dump().items())
+        return f"{type(self).__name__}({fields})"
+
+    @staticmethod
+    def _check_attrs(model: Type[BaseModel], attrs: Dict[str, Any]) -> None:
+        """Reject extra fields that ``to_model`` would silently drop."""
+        if model.model_config.get("extra") == "allow":
+            return
+        unknown = attrs.keys() - model.model_fields.keys()
+        if unknown:
+            raise ValueError(f"{model.__name__} has no field(s) {', '.join(sorted(unknown))}")
+
+    def model_dump(self, exclude: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Plain field dict, mirroring the pydantic method of the same name."""
+        data = {key: getattr(self, key) for key in self._fields}
+        if self.attrs:
+            data.update(self.attrs)
+        for key in exclude or ():
+            data.pop(key, None)
+        return data
+
+class NodeRecord(_Record):
+    """Lightweight ``__slots__`` stand-in for a Node model.
+
+    Fields beyond ``id``/``name`` live in ``attrs`` and read as attributes;
+    ``to_model`` rebuilds (and validates) the pydantic model it came from.
+    ``attrs`` must be fields of that model (``Node`` when none is given),
+    otherwise ValueError is raised.
+    """
+    __slots__ = ("id", "name", "graph", "attrs", "model")
+    _fields = ("id", "name")
+
+    edges = Node.edges
+    neighbors = Node.neighbors
+
+    def __init__(self, id: str, name: Optional[str] = None, *, model: Optional[Type[Node]] = None, **attrs: Any) -> None:
+        if attrs:
+            self._check_attrs(model or Node, attrs)
+        self.id = id
+        self.name = name
+        self.graph: Optional[Graph] = None
+        self.attrs = attrs or None
+        self.model = model
+
+    @classmethod
+    def from_model(cls, node: Node) -> NodeRecord:
+        attrs = {key: value for key, value in node.__dict__.items() if key not in ("id", "name", "graph")}
+        return cls(node.id, node.name, model=type(node), **attrs)
+
+    def to_model(self) -> Node:
+        return (self.model or Node)(**self.model_dump())
+
+    def copy(self) -> NodeRecord:
+        return NodeRecord(self.id, self.name, model=self.model, **(self.attrs or {}))
+
+class EdgeRecord(_Record):
+    """Lightweight ``__slots__`` stand-in for an Edge model (see ``NodeRecord``)."""
+    __slots__ = ("id", "name", "source", "target", "attrs", "model")
+    _fields = ("id", "name", "source", "target")
+
+    def __init__(
+        self,
+        id: str,
+        source: str,
+        target: str,
+        name: Optional[str] = None,
+        *,
+        model: Optional[Type[Edge]] = None,
+        **attrs: Any,
+    ) -> None:
+        if attrs:
+            self._check_attrs(model or Edge, attrs)
+        self.id = id
+        self.name = name
+        self.source = source
+        self.target = target
+        self.attrs = attrs or None
+        self.model = model
+
+    @classmethod
+    def from_model(cls, edge: Edge) -> EdgeRecord:
+        attrs = {key: value for key, value in edge.__dict__.items() if key not in cls._fields}
+        return cls(edge.id, edge.source, edge.target, edge.name, model=type(edge), **attrs)
+
+    def to_model(self) -> Edge:
+        return (self.model or Edge)(**self.model_dump())
+
+    def copy(self) -> EdgeRecord:
+        return EdgeRecord(self.id, self.source, self.target, self.name, model=self.model, **(self.attrs or {}))
+
 class NodeSearchQuery(BaseModel):
     """Container describing a node search request."""
     pattern: str
@@ -112,7 +272,7 @@ class RegexNodeSearch(NodeSearchStrategy):
                     node_id=node.id,
                     score=float(matches["score"]),
                     highlights=matches["highlights"],
-                    node=node,
+                    node=node if isinstance(node, Node) else None,
                 )
             )
             if query.limit and len(results) >= query.limit:
@@ -142,15 +302,17 @@ class RegexNodeSearch(NodeSearchStrategy):
         return {"score": len(highlights), "highlights": highlights}
 
     def _resolve_fields(self, node: Node) -> List[str]:
-        if isinstance(node, PropertyNode):
-            return ["id", "name", *node.properties.keys()]
+        properties = getattr(node, "properties", None)
+        if isinstance(properties, dict):
+            return ["id", "name", *properties.keys()]
         return ["id", "name"]
 
     def _extract_field(self, node: Node, field_name: str) -> Any:
         if hasattr(node, field_name):
             return getattr(node, field_name)
-        if isinstance(node, PropertyNode):
-            return node.properties.get(field_name)
+        properties = getattr(node, "properties", None)
+        if isinstance(properties, dict):
+            return properties.get(field_name)
         return None
 
 class TFIDFNodeSearch(NodeSearchStrategy):
@@ -171,43 +333,333 @@ class BM25NodeSearch(NodeSearchStrategy):
     def search(self, nodes: Sequence[Node], query: NodeSearchQuery) -> List[NodeSearchResult]:
         raise NotImplementedError("BM25 search strategy not implemented.")
 
+class _GraphIndex:
+    """Mutable lookup state kept alongside a graph's node and edge lists.
+
+    Held in a single private attribute so hot paths pay for one pydantic
+    private-attribute lookup instead of one per structure.
+    """
+    __slots__ = ("nodes", "edges", "out_edges", "in_edges", "version", "weights_version", "cache", "cache_version")
+
+    def __init__(self) -> None:
+        self.nodes: Dict[str, Node] = {}
+        self.edges: Dict[str, Edge] = {}
+        self.out_edges: Dict[str, List[Edge]] = {}
+        self.in_edges: Dict[str, List[Edge]] = {}
+        self.version = 0
+        self.weights_version = 0
+        self.cache: Dict[str, Any] = {}
+        self.cache_version: Any = None
+
 class Graph(BaseModel):
-    """Graph-level structure holding nodes and edges."""
+    """Graph-level structure holding nodes and edges.
+
+    With ``record_mode="slots"`` nodes and edges are stored as
+    NodeRecord/EdgeRecord objects instead of pydantic models; models passed
+    in are converted on the way in, and ``to_pydantic`` or serialization
+    (``model_dump``/``model_dump_json``) converts back.
+    """
+    directed: ClassVar[bool] = False
     id: str
     name: Optional[str] = None
     nodes: List[Node] = Field(default_factory=list)
     edges: List[Edge] = Field(default_factory=list)
+    record_mode: Literal["pydantic", "slots"] = "pydantic"
     _search_strategies: Dict[str, NodeSearchStrategy] = PrivateAttr(default_factory=dict)
     _default_strategy_key: Optional[str] = PrivateAttr(default=None)
+    _index: _GraphIndex = PrivateAttr(default_factory=_GraphIndex)
 
     def __init__(self, **data: Any):
+        pending = None
+        if data.get("record_mode") == "slots":
+            pending = data.pop("nodes", ()), data.pop("edges", ())
         super().__init__(**data)
+        self._reindex()
+        if pending:
+            self.add_nodes_from(pending[0])
+            self.add_edges_from(pending[1])
         self.register_search_strategy(RegexNodeSearch(), default=True)
 
+    @field_serializer("nodes", "edges", mode="wrap")
+    def _serialize_records(self, items: List[Any], handler: SerializerFunctionWrapHandler) -> Any:
+        """Serialize slots records as the models they stand in for."""
+        if self.record_mode == "slots":
+            items = [item.to_model() for item in items]
+        return handler(items)
+
+    def __contains__(self, node: object) -> bool:
+        """Whether the given node (or an equal one) belongs to this graph."""
+        if not isinstance(node, (Node, NodeRecord)):
+            return False
+        found = self._index.nodes.get(node.id)
+        return found is not None and (found is node or found == node)
+
+    @property
+    def version(self) -> int:
+        """Mutation counter, bumped by every structural change."""
+        return self._index.version
+
     def add_node(self, node: Node):
         """Add a node and link it to this graph."""
-        node.graph = self
-        self.nodes.append(node)
+        index = self._index
+        self._insert_node(self._coerce_node(node), index)
+        index.version += 1
 
     def add_edge(self, edge: Edge):
         """Add an edge and ensure referenced nodes exist."""
-        self.edges.append(edge)
+        index = self._index
+        if self._insert_edge(self._coerce_edge(edge), index):
+            index.version += 1
+
+    def add_nodes_from(
+        self,
+        nodes: Union[Iterable[Any], Mapping[str, Sequence[Any]]],
+        *,
+        node_type: Type[Node] = Node,
+    ) -> None:
+        """Add many nodes in one pass.
+
+        ``nodes`` may yield Node instances, plain ids, ``(id, attrs)`` tuples
+        or field dicts, or be a mapping of column name to parallel sequences.
+        The cyclic garbage collector is paused for the duration of the load;
+        the pause is process-wide, so it also applies to other threads.
+        """
+        if self.record_mode == "slots":
+            build = partial(NodeRecord, model=node_type)
+        else:
+            build = node_type
+        index = self._index
+        insert = self._insert_node
+        try:
+            with _paused_gc():
+                for item in _iter_records(nodes):
+                    if isinstance(item, (Node, NodeRecord)):
+                        node = self._coerce_node(item)
+                    elif isinstance(item, str):
+                        node = build(id=item)
+                    elif isinstance(item, tuple):
+                        node = build(id=item[0], **(item[1] if len(item) > 1 else {}))
+                    else:
+                        node = build(**item)
+                    insert(node, index)
+        finally:
+            index.version += 1
+
+    def add_edges_from(
+        self,
+        edges: Union[Iterable[Any], Mapping[str, Sequence[Any]]],
+        *,
+        edge_type: Type[Edge] = Edge,
+    ) -> None:
+        """Add many edges in one pass.
+
+        ``edges`` may yield Edge instances, ``(id, source, target)`` or
+        ``(id, source, target, attrs)`` tuples or field dicts, or be a mapping
+        of column name to parallel sequences. The garbage collector is
+        paused as in ``add_nodes_from``.
+        """
+        if self.record_mode == "slots":
+            build = partial(EdgeRecord, model=edge_type)
+        else:
+            build = edge_type
+        index = self._index
+        insert = self._insert_edge
+        try:
+            with _paused_gc():
+                for item in _iter_records(edges):
+                    if isinstance(item, (Edge, EdgeRecord)):
+                        edge = self._coerce_edge(item)
+                    elif isinstance(item, tuple):
+                        edge_id, source, target = item[:3]
+                        edge = build(id=edge_id, source=source, target=target, **(item[3] if len(item) > 3 else {}))
+                    else:
+                        edge = build(**item)
+                    insert(edge, index)
+        finally:
+            index.version += 1
+
+    def remove_node(self, node_id: str) -> Node:
+        """Remove a node together with every edge touching it."""
+        index = self._index
+        node = index.nodes.get(node_id)
+        if node is None:
+            raise KeyError(f"Node '{node_id}' is not in graph '{self.id}'")
+        for edge in [*index.out_edges.get(node_id, ()), *index.in_edges.get(node_id, ())]:
+            if edge.id in index.edges:
+                self._discard_edge(edge, index)
+        del index.nodes[node_id]
+        index.out_edges.pop(node_id, None)
+        index.in_edges.pop(node_id, None)
+        self.nodes.remove(node)
+        node.graph = None
+        index.version += 1
+        return node
+
+    def remove_edge(self, edge_id: str) -> Edge:
+        """Remove an edge by id."""
+        index = self._index
+        edge = index.edges.get(edge_id)
+        if edge is None:
+            raise KeyError(f"Edge '{edge_id}' is not in graph '{self.id}'")
+        self._discard_edge(edge, index)
+        index.version += 1
+        return edge
 
     def get_node(self, node_id: str) -> Optional[Node]:
-        return next((n for n in self.nodes if n.id == node_id), None)
+        return self._index.nodes.get(node_id)
 
     def get_edge(self, edge_id: str) -> Optional[Edge]:
-        return next((e for e in self.edges if e.id == edge_id), None)
+        return self._index.edges.get(edge_id)
+
+    def out_edges(self, node_id: str) -> List[Edge]:
+        """Edges whose source is node_id."""
+        return list(self._index.out_edges.get(node_id, ()))
+
+    def in_edges(self, node_id: str) -> List[Edge]:
+        """Edges whose target is node_id."""
+        return list(self._index.in_edges.get(node_id, ()))
+
+    def to_pydantic(self) -> Graph:
+        """Return the graph with every record converted to its validated model.
+
+        Graphs already in pydantic record mode are returned unchanged.
+        """
+        if self.record_mode == "pydantic":
+            return self
+        graph = type(self)(id=self.id, name=self.name)
+        graph.add_nodes_from(node.to_model() for node in self.nodes)
+        graph.add_edges_from(edge.to_model() for edge in self.edges)
+        return graph
+
+    def _coerce_node(self, node: Union[Node, NodeRecord]) -> Union[Node, NodeRecord]:
+        """Convert between models and records to match ``record_mode``."""
+        if self.record_mode == "slots":
+            return node if isinstance(node, NodeRecord) else NodeRecord.from_model(node)
+        return node.to_model() if isinstance(node, NodeRecord) else node
+
+    def _coerce_edge(self, edge: Union[Edge, EdgeRecord]) -> Union[Edge, EdgeRecord]:
+        if self.record_mode == "slots":
+            return edge if isinstance(edge, EdgeRecord) else EdgeRecord.from_model(edge)
+        return edge.to_model() if isinstance(edge, EdgeRecord) else edge
+
+    def _insert_node(self, node: Node, index: _GraphIndex) -> None:
+        """Index and append a node, rejecting duplicate ids."""
+        if node.id in index.nodes:
+            raise ValueError(f"Node '{node.id}' already exists in graph '{self.id}'")
+        node.graph = self
+        index.nodes[node.id] = node
+        self.nodes.append(node)
+
+    def _insert_edge(self, edge: Edge, index: _GraphIndex) -> bool:
+        """Index and append an edge, rejecting duplicate ids.
+
+        Returns False when the edge was skipped without error.
+        """
+        if edge.id in index.edges:
+            raise ValueError(f"Edge '{edge.id}' already exists in graph '{self.id}'")
+        index.edges[edge.id] = edge
+        index.out_edges.setdefault(edge.source, []).append(edge)
+        index.in_edges.setdefault(edge.target, []).append(edge)
+        self.edges.append(edge)
+        if isinstance(edge, Edge):
+            edge._attach(index)
+        return True
+
+    def _discard_edge(self, edge: Edge, index: _GraphIndex) -> None:
+        """Drop an indexed edge from the edge list and indexes."""
+        del index.edges[edge.id]
+        index.out_edges[edge.source].remove(edge)
+        index.in_edges[edge.target].remove(edge)
+        self.edges.remove(edge)
+        if isinstance(edge, Edge):
+            edge._detach(index)
+
+    def _cached(self, key: str, builder: Callable[[], Any]) -> Any:
+        """Return a derived view, rebuilding it only after mutations or weight changes."""
+        index = self._index
+        stamp = (index.version, index.weights_version)
+        if index.cache_version != stamp:
+            index.cache = {}
+            index.cache_version = stamp
+        cache = index.cache
+        if key not in cache:
+            cache[key] = builder()
+        return cache[key]
+
+    def _reindex(self) -> None:
+        """Rebuild the lookup indexes from the node and edge lists."""
+        nodes, edges = list(self.nodes), list(self.edges)
+        self.nodes.clear()
+        self.edges.clear()
+        index = self._index = type(self._index)()
+        for node in nodes:
+            self._insert_node(node, index)
+        for edge in edges:
+            self._insert_edge(edge, index)
+        index.version += 1
 
     @property
     def adjacency(self) -> dict[str, list[str]]:
-        """View: adjacency list representation."""
+        """View: adjacency list representation.
+
+        Built once per graph version and shared between callers, so treat
+        the returned mapping as read-only.
+        """
+        return self._cached("adjacency", self._build_adjacency)
+
+    def _build_adjacency(self) -> dict[str, list[str]]:
         adj = {n.id: [] for n in self.nodes}
         for e in self.edges:
             adj[e.source].append(e.target)
             adj[e.target].append(e.source)
         return adj
 
+    @property
+    def weighted_adjacency(self) -> dict[str, list[tuple[str, float]]]:
+        """View: adjacency list of ``(neighbor_id, weight)`` pairs.
+
+        Weights come from each edge's ``weight`` attribute (1.0 when absent or
+        not numeric). Cached like ``adjacency``; treat as read-only.
+        """
+        return self._cached("weighted_adjacency", self._build_weighted_adjacency)
+
+    def _build_weighted_adjacency(self) -> dict[str, list[tuple[str, float]]]:
+        adj = {n.id: [] for n in self.nodes}
+        for e in self.edges:
+            weight = edge_weight(e)
+            adj[e.source].append((e.target, weight))
+            adj[e.target].append((e.source, weight))
+        return adj
+
+    @property
+    def reverse_adjacency(self) -> dict[str, list[str]]:
+        """View: adjacency list following edges backwards.
+
+        Identical to ``adjacency`` for graphs whose edges are symmetric.
+        """
+        return self._cached("reverse_adjacency", self._build_reverse_adjacency)
+
+    def _build_reverse_adjacency(self) -> dict[str, list[str]]:
+        return self.adjacency
+
+    @property
+    def weighted_reverse_adjacency(self) -> dict[str, list[tuple[str, float]]]:
+        """View: ``weighted_adjacency`` following edges backwards."""
+        return self._cached("weighted_reverse_adjacency", self._build_weighted_reverse_adjacency)
+
+    def _build_weighted_reverse_adjacency(self) -> dict[str, list[tuple[str, float]]]:
+        return self.weighted_adjacency
+
+    def to_csr(self) -> CSRGraph:
+        """Frozen CSR snapshot of this graph, cached until the next mutation."""
+        from .graphs.csr import CSRGraph
+
+        return self._cached("csr", lambda: CSRGraph.from_graph(self))
+
+    def to_adjacency_matrix(self, dtype: str = "float64") -> Any:
+        """Dense NumPy weight matrix in ``to_csr().node_ids`` order (see ``CSRGraph.to_adjacency_matrix``)."""
+        return self.to_csr().to_adjacency_matrix(dtype)
+
     def register_search_strategy(self, strategy: NodeSearchStrategy, *, alias: Optional[str] = None, default: bool = False) -> None:
         """Register a search strategy for later use."""
         key = alias or strategy.name
@@ -244,6 +696,24 @@ class Graph(BaseModel):
         results = strategy_impl.search(self.nodes, normalized_query)
         return results
 
+    async def asearch_nodes(
+        self,
+        query: Union[NodeSearchQuery, str],
+        *,
+        strategy: Union[None, str, NodeSearchStrategy] = None,
+        timeout: Optional[float] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[NodeSearchResult]:
+        """``search_nodes`` on an executor (the loop's default one unless given).
+
+        Raises ``asyncio.TimeoutError`` after ``timeout`` seconds. Timing out
+        or cancelling abandons the result, but a search that already started
+        finishes in its worker thread; avoid mutating the graph meanwhile.
+        """
+        loop = asyncio.get_running_loop()
+        search = loop.run_in_executor(executor, partial(self.search_nodes, query, strategy=strategy))
+        return await asyncio.wait_for(search, timeout)
+
     def _resolve_search_strategy(
         self, strategy: Union[None, str, NodeSearchStrategy]
     ) -> NodeSearchStrategy:
@@ -260,11 +730,47 @@ class Graph(BaseModel):
         raise UnknownStrategyError("No search strategies have been registered for this graph.")
 
 
+def edge_weight(edge: Edge) -> float:
+    """Numeric weight of an edge, defaulting to 1.0."""
+    weight = getattr(edge, "weight", 1.0)
+    try:
+        return float(weight)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+@contextmanager
+def _paused_gc() -> Iterator[None]:
+    """Suspend the cyclic garbage collector while allocating many objects.
+
+    ``gc`` state is global: every thread runs without cyclic collection
+    until the block exits.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _iter_records(data: Union[Iterable[Any], Mapping[str, Sequence[Any]]]) -> Iterable[Any]:
+    """Yield row items, turning a column mapping into per-row dicts."""
+    if isinstance(data, Mapping):
+        columns = list(data.keys())
+        return (dict(zip(columns, row)) for row in zip(*data.values()))
+    return data
+
+
 __all__ = [
     "Graph",
     "Edge",
+    "WeightedEdge",
     "Node",
     "PropertyNode",
+    "NodeRecord",
+    "EdgeRecord",
     "NodeSearchQuery",
     "NodeSearchResult",
     "NodeSearchStrategy",
@@ -273,5 +779,6 @@ __all__ = [
     "BM25NodeSearch",
     "SearchError",
     "UnknownStrategyError",
+    "NegativeCycleError",
 ]
 
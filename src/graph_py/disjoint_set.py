@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Dict, Hashable, Iterable, List
+
+
+class DisjointSet:
+    """Union-find over hashable items with path compression and union by rank.
+
+    ``find``, ``union`` and ``connected`` run in amortized near-constant
+    time. Unknown items are added by ``union``; ``find`` raises KeyError.
+    """
+
+    __slots__ = ("parent", "rank", "count")
+
+    def __init__(self, items: Iterable[Hashable] = ()) -> None:
+        self.parent: Dict[Hashable, Hashable] = {}
+        self.rank: Dict[Hashable, int] = {}
+        self.count = 0
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.parent
+
+    def add(self, item: Hashable) -> None:
+        """Add item as a singleton set (no-op if already present)."""
+        if item not in self.parent:
+            self.parent[item] = item
+            self.rank[item] = 0
+            self.count += 1
+
+    def find(self, item: Hashable) -> Hashable:
+        """Representative of item's set."""
+        parent = self.parent
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+        return root
+
+    def union(self, item_a: Hashable, item_b: Hashable) -> bool:
+        """Merge the sets of both items; False when they were already joined."""
+        self.add(item_a)
+        self.add(item_b)
+        root_a, root_b = self.find(item_a), self.find(item_b)
+        if root_a == root_b:
+            return False
+        rank = self.rank
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+        self.count -= 1
+        return True
+
+    def connected(self, item_a: Hashable, item_b: Hashable) -> bool:
+        return self.find(item_a) == self.find(item_b)
+
+    def groups(self) -> List[List[Hashable]]:
+        """Members of every set, in first-seen order."""
+        members: Dict[Hashable, List[Hashable]] = {}
+        for item in self.parent:
+            members.setdefault(self.find(item), []).append(item)
+        return list(members.values())
+
+
+__all__ = ["DisjointSet"]
@@ -1,5 +1,5 @@
+from .csr import CSRGraph
 from .directed import DirectedGraph
 from .undirected import UndirectedGraph
 
-__all__ = ['DirectedGraph', 'UndirectedGraph']
-
+__all__ = ['CSRGraph', 'DirectedGraph', 'UndirectedGraph']
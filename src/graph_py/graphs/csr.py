@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from ..core import Graph, Node, NodeRecord
+
+
+class CSRGraph:
+    """Frozen compressed-sparse-row snapshot of a graph.
+
+    Nodes are numbered ``0..n-1`` in ``graph.nodes`` order. The out-neighbours
+    of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]`` with matching
+    ``weights``. Symmetric graphs store every edge in both directions.
+    """
+
+    __slots__ = ("id", "directed", "nodes", "node_ids", "index", "indptr", "indices", "weights", "_reverse")
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        directed: bool,
+        nodes: Sequence[Node],
+        indptr: array,
+        indices: array,
+        weights: array,
+    ) -> None:
+        set_ = object.__setattr__
+        set_(self, "id", id)
+        set_(self, "directed", directed)
+        set_(self, "nodes", tuple(nodes))
+        set_(self, "node_ids", tuple(node.id for node in nodes))
+        set_(self, "index", {node_id: i for i, node_id in enumerate(self.node_ids)})
+        set_(self, "indptr", indptr)
+        set_(self, "indices", indices)
+        set_(self, "weights", weights)
+        set_(self, "_reverse", None if directed else self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("CSRGraph is immutable")
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> CSRGraph:
+        """Snapshot the adjacency and edge weights of any Graph subclass."""
+        adjacency = graph.weighted_adjacency
+        index = {node.id: i for i, node in enumerate(graph.nodes)}
+
+        indptr = array("q", [0])
+        indices = array("q")
+        weights = array("d")
+        for node in graph.nodes:
+            for neighbor_id, weight in adjacency.get(node.id, ()):
+                indices.append(index[neighbor_id])
+                weights.append(weight)
+            indptr.append(len(indices))
+
+        return cls(
+            id=graph.id,
+            directed=graph.directed,
+            nodes=graph.nodes,
+            indptr=indptr,
+            indices=indices,
+            weights=weights,
+        )
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node: object) -> bool:
+        if not isinstance(node, (Node, NodeRecord)):
+            return False
+        i = self.index.get(node.id)
+        return i is not None and (self.nodes[i] is node or self.nodes[i] == node)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of stored (directed) adjacency entries."""
+        return len(self.indices)
+
+    def get_node(self, node_id: str) -> Optional[Node]:
+        i = self.index.get(node_id)
+        return None if i is None else self.nodes[i]
+
+    def index_of(self, node_id: str) -> int:
+        """Integer index of node_id; raises KeyError when unknown."""
+        return self.index[node_id]
+
+    def neighbors(self, i: int) -> Iterator[Tuple[int, float]]:
+        """Yield ``(neighbor_index, weight)`` pairs for node index ``i``."""
+        indices, weights = self.indices, self.weights
+        for k in range(self.indptr[i], self.indptr[i + 1]):
+            yield indices[k], weights[k]
+
+    def degree(self, i: int) -> int:
+        return self.indptr[i + 1] - self.indptr[i]
+
+    def reverse(self) -> CSRGraph:
+        """Transposed snapshot (the graph itself when edges are symmetric)."""
+        if self._reverse is None:
+            object.__setattr__(self, "_reverse", self._transpose())
+        return self._reverse
+
+    def to_numpy(self) -> Tuple[Any, Any, Any]:
+        """Zero-copy NumPy views of ``(indptr, indices, weights)``."""
+        try:
+            import numpy as np
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("CSRGraph.to_numpy requires numpy") from exc
+        return (
+            np.frombuffer(self.indptr, dtype=np.int64),
+            np.frombuffer(self.indices, dtype=np.int64),
+            np.frombuffer(self.weights, dtype=np.float64),
+        )
+
+    def to_adjacency_matrix(self, dtype: str = "float64") -> Any:
+        """Dense ``(n, n)`` NumPy weight matrix, ``inf`` where there is no edge.
+
+        Parallel edges keep their smallest weight; the diagonal only holds
+        self-loops.
+        """
+        indptr, indices, weights = self.to_numpy()
+        import numpy as np
+
+        node_count = len(self.nodes)
+        matrix = np.full((node_count, node_count), np.inf, dtype=dtype)
+        rows = np.repeat(np.arange(node_count), np.diff(indptr))
+        np.minimum.at(matrix, (rows, indices), weights.astype(dtype))
+        return matrix
+
+    def path_nodes(self, path: List[int]) -> List[Node]:
+        """Map a list of node indices back to node objects."""
+        nodes = self.nodes
+        return [nodes[i] for i in path]
+
+    def _transpose(self) -> CSRGraph:
+        n = len(self.nodes)
+        counts = [0] * (n + 1)
+        for target in self.indices:
+            counts[target + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        indptr = array("q", counts)
+        cursor = counts[:-1]
+        indices = array("q", bytes(8 * len(self.indices)))
+        weights = array("d", bytes(8 * len(self.weights)))
+        for source in range(n):
+            for k in range(self.indptr[source], self.indptr[source + 1]):
+                target = self.indices[k]
+                slot = cursor[target]
+                indices[slot] = source
+                weights[slot] = self.weights[k]
+                cursor[target] = slot + 1
+        reverse = CSRGraph(
+            id=self.id,
+            directed=True,
+            nodes=self.nodes,
+            indptr=indptr,
+            indices=indices,
+            weights=weights,
+        )
+        object.__setattr__(reverse, "_reverse", self)
+        return reverse
+
@@ -1,22 +1,60 @@
-from ..core import Graph, Edge, Node
+from typing import ClassVar, Dict, Iterable
+
+from ..core import Graph, Edge, Node, edge_weight
 
 class DirectedGraph(Graph):
     """Graph representation with directed edges."""
+    directed: ClassVar[bool] = True
 
-    @property
-    def adjacency(self) -> dict[str, list[str]]:
+    def _build_adjacency(self) -> dict[str, list[str]]:
         """Adjacency list respecting edge direction."""
         adj = {n.id: [] for n in self.nodes}
         for e in self.edges:
             adj[e.source].append(e.target)
         return adj
 
+    def _build_weighted_adjacency(self) -> dict[str, list[tuple[str, float]]]:
+        """Weighted adjacency list respecting edge direction."""
+        adj = {n.id: [] for n in self.nodes}
+        for e in self.edges:
+            adj[e.source].append((e.target, edge_weight(e)))
+        return adj
+
+    def _build_reverse_adjacency(self) -> dict[str, list[str]]:
+        """Adjacency list mapping each node to its predecessors."""
+        adj = {n.id: [] for n in self.nodes}
+        for e in self.edges:
+            adj[e.target].append(e.source)
+        return adj
+
+    def _build_weighted_reverse_adjacency(self) -> dict[str, list[tuple[str, float]]]:
+        """Weighted adjacency list mapping each node to its predecessors."""
+        adj = {n.id: [] for n in self.nodes}
+        for e in self.edges:
+            adj[e.target].append((e.source, edge_weight(e)))
+        return adj
+
     def successors(self, node_id: str) -> list[Node]:
         """Nodes reachable by outgoing edges."""
-        ids = [e.target for e in self.edges if e.source == node_id]
-        return [n for n in self.nodes if n.id in ids]
+        return self._resolve_unique(e.target for e in self._index.out_edges.get(node_id, ()))
 
     def predecessors(self, node_id: str) -> list[Node]:
         """Nodes with edges incoming to node_id."""
-        ids = [e.source for e in self.edges if e.target == node_id]
-        return [n for n in self.nodes if n.id in ids]
\ No newline at end of file
+        return self._resolve_unique(e.source for e in self._index.in_edges.get(node_id, ()))
+
+    def out_degree(self, node_id: str) -> int:
+        """Number of edges leaving node_id."""
+        return len(self._index.out_edges.get(node_id, ()))
+
+    def in_degree(self, node_id: str) -> int:
+        """Number of edges entering node_id."""
+        return len(self._index.in_edges.get(node_id, ()))
+
+    def _resolve_unique(self, node_ids: Iterable[str]) -> list[Node]:
+        nodes: Dict[str, Node] = {}
+        for node_id in node_ids:
+            if node_id not in nodes:
+                node = self.get_node(node_id)
+                if node is not None:
+                    nodes[node_id] = node
+        return list(nodes.values())
@@ -1,10 +1,28 @@
-from ..core import Graph, Edge, Node
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import PrivateAttr
+
+from ..core import Graph, Edge, Node, _GraphIndex
+from ..disjoint_set import DisjointSet
+
+class _UndirectedIndex(_GraphIndex):
+    """Graph index extended with a canonical unordered-pair lookup.
+
+    ``components`` is built on the first connectivity query, then kept up
+    to date by insertions and dropped again by removals.
+    """
+    __slots__ = ("pairs", "components")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pairs: Dict[Tuple[str, str], str] = {}
+        self.components: Optional[DisjointSet] = None
 
 class UndirectedGraph(Graph):
     """Graph representation with undirected edges."""
+    _index: _UndirectedIndex = PrivateAttr(default_factory=_UndirectedIndex)
 
-    @property
-    def adjacency(self) -> dict[str, list[str]]:
+    def _build_adjacency(self) -> dict[str, list[str]]:
         """Adjacency list treating edges as symmetric."""
         adj = {n.id: [] for n in self.nodes}
         for e in self.edges:
@@ -12,21 +30,67 @@ class UndirectedGraph(Graph):
             adj[e.target].append(e.source)
         return adj
 
-    def add_edge(self, edge: Edge):
-        """Add edge only if not already represented (A–B same as B–A)."""
-        if not any(
-            (e.source == edge.source and e.target == edge.target) or
-            (e.source == edge.target and e.target == edge.source)
-            for e in self.edges
-        ):
-            self.edges.append(edge)
+    def has_edge_between(self, node_a: str, node_b: str) -> bool:
+        """Whether an edge joins the two nodes, in either orientation."""
+        return _pair_key(node_a, node_b) in self._index.pairs
+
+    def connected(self, node_a: str, node_b: str) -> bool:
+        """Whether a path joins the two nodes; raises KeyError for unknown ids."""
+        return self._components().connected(node_a, node_b)
+
+    def connected_components(self) -> List[List[str]]:
+        """Node ids of every connected component."""
+        return self._components().groups()
+
+    @property
+    def component_count(self) -> int:
+        return self._components().count
+
+    def remove_node(self, node_id: str) -> Node:
+        node = super().remove_node(node_id)
+        self._index.components = None
+        return node
+
+    def _components(self) -> DisjointSet:
+        index = self._index
+        if index.components is None:
+            components = DisjointSet(node.id for node in self.nodes)
+            for edge in self.edges:
+                components.union(edge.source, edge.target)
+            index.components = components
+        return index.components
+
+    def _insert_node(self, node: Node, index: _UndirectedIndex) -> None:
+        super()._insert_node(node, index)
+        if index.components is not None:
+            index.components.add(node.id)
+
+    def _insert_edge(self, edge: Edge, index: _UndirectedIndex) -> bool:
+        """Insert edge only if not already represented (A–B same as B–A)."""
+        key = _pair_key(edge.source, edge.target)
+        if key in index.pairs:
+            return False
+        inserted = super()._insert_edge(edge, index)
+        if inserted:
+            index.pairs[key] = edge.id
+            if index.components is not None:
+                index.components.union(edge.source, edge.target)
+        return inserted
+
+    def _discard_edge(self, edge: Edge, index: _UndirectedIndex) -> None:
+        super()._discard_edge(edge, index)
+        key = _pair_key(edge.source, edge.target)
+        if index.pairs.get(key) == edge.id:
+            del index.pairs[key]
+        # Union-find cannot split sets; rebuild on the next query.
+        index.components = None
 
     def neighbors(self, node_id: str) -> list[Node]:
         """Return all nodes connected to node_id."""
-        ids = set()
-        for e in self.edges:
-            if e.source == node_id:
-                ids.add(e.target)
-            elif e.target == node_id:
-                ids.add(e.source)
-        return [n for n in self.nodes if n.id in ids]
+        node = self.get_node(node_id)
+        return node.neighbors if node is not None else []
+
+
+def _pair_key(node_a: str, node_b: str) -> Tuple[str, str]:
+    """Orientation-independent key for an unordered node pair."""
+    return (node_a, node_b) if node_a <= node_b else (node_b, node_a)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from graph_py import DisjointSet
+from graph_py.algorithms import bfs, strongly_connected_components
+from graph_py.core import Edge, Node
+from graph_py.graphs import DirectedGraph, UndirectedGraph
+
+
+def _directed(node_ids, edges):
+    graph = DirectedGraph(id="g")
+    graph.add_nodes_from(node_ids)
+    graph.add_edges_from((f"{source}-{target}", source, target) for source, target in edges)
+    return graph
+
+
+def test_strongly_connected_components_and_condensation():
+    edges = [(i, (i * 7 + 3) % 40) for i in range(40)] + [(i, (i * i + 1) % 40) for i in range(0, 40, 3)]
+    graph = _directed([str(i) for i in range(41)], [(str(a), str(b)) for a, b in edges])
+    sccs = strongly_connected_components(graph)
+
+    for a in graph.nodes[::3]:
+        for b in graph.nodes[::2]:
+            mutual = bfs(graph, a, b) is not None and bfs(graph, b, a) is not None
+            assert sccs.same_component(a, b) == mutual
+
+    assert sorted(node_id for members in sccs.components() for node_id in members) == sorted(node.id for node in graph.nodes)
+    dag = sccs.condensation()
+    assert len(dag.nodes) == len(sccs)
+    assert all(int(edge.source) < int(edge.target) for edge in dag.edges)
+
+
+def test_strongly_connected_components_handle_long_paths():
+    length = sys.getrecursionlimit() * 3
+    graph = _directed([str(i) for i in range(length)], [(str(i), str(i + 1)) for i in range(length - 1)])
+    graph.add_edge(Edge(id="back", source=str(length - 1), target="0"))
+    graph.add_node(Node(id="tail"))
+    graph.add_edge(Edge(id="into-tail", source="0", target="tail"))
+
+    sccs = strongly_connected_components(graph)
+    assert len(sccs) == 2
+    assert sccs.component_of(graph.get_node("0")) < sccs.component_of(graph.get_node("tail"))
+    assert list(sccs.dag_indices) == [1]
+
+
+def test_disjoint_set_union_find():
+    sets = DisjointSet("abcd")
+    assert sets.union("a", "b") and sets.union("c", "d") and not sets.union("b", "a")
+    assert sets.connected("a", "b") and not sets.connected("a", "c")
+    assert sets.union("e", "a") and len(sets) == 5 and sets.count == 2
+    assert sorted(map(sorted, sets.groups())) == [["a", "b", "e"], ["c", "d"]]
+
+
+def test_undirected_connectivity_tracks_mutations():
+    graph = UndirectedGraph(id="g")
+    graph.add_nodes_from("ABCDE")
+    graph.add_edges_from([("e1", "A", "B"), ("e2", "C", "D")])
+    assert graph.component_count == 3
+    assert graph.connected("A", "B") and not graph.connected("A", "C")
+
+    graph.add_edge(Edge(id="e3", source="B", target="C"))
+    graph.add_node(Node(id="F"))
+    assert graph._index.components is not None
+    assert graph.connected("A", "D") and graph.component_count == 3
+
+    graph.remove_edge("e3")
+    assert not graph.connected("A", "D") and graph.component_count == 4
+    graph.remove_node("E")
+    assert sorted(map(sorted, graph.connected_components())) == [["A", "B"], ["C", "D"], ["F"]]
+    with pytest.raises(KeyError):
+        graph.connected("A", "E")
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from graph_py.core import Edge, EdgeRecord, Graph, Node, NodeRecord, PropertyNode, WeightedEdge
+
+
+def test_lookup_indexes_follow_add_calls():
+    graph = Graph(id="g")
+    node = Node(id="A")
+    graph.add_node(node)
+    graph.add_node(Node(id="B"))
+    edge = Edge(id="e1", source="A", target="B")
+    graph.add_edge(edge)
+
+    assert graph.get_node("A") is node
+    assert graph.get_edge("e1") is edge
+    assert graph.get_node("missing") is None
+    assert graph.get_edge("missing") is None
+
+
+def test_constructor_nodes_are_indexed_and_linked():
+    graph = Graph(id="g", nodes=[Node(id="A"), Node(id="B")], edges=[Edge(id="e1", source="A", target="B")])
+
+    assert graph.get_node("B").graph is graph
+    assert graph.get_edge("e1").target == "B"
+
+
+def test_duplicate_ids_are_rejected():
+    graph = Graph(id="g")
+    graph.add_node(Node(id="A"))
+    graph.add_node(Node(id="B"))
+    graph.add_edge(Edge(id="e1", source="A", target="B"))
+
+    with pytest.raises(ValueError):
+        graph.add_node(Node(id="A"))
+    with pytest.raises(ValueError):
+        graph.add_edge(Edge(id="e1", source="B", target="A"))
+    assert len(graph.nodes) == 2
+    assert len(graph.edges) == 1
+
+
+def test_adjacency_is_cached_until_mutation():
+    graph = Graph(id="g")
+    graph.add_node(Node(id="A"))
+    graph.add_node(Node(id="B"))
+    graph.add_edge(Edge(id="e1", source="A", target="B"))
+
+    first = graph.adjacency
+    assert graph.adjacency is first
+    assert first == {"A": ["B"], "B": ["A"]}
+
+    graph.add_node(Node(id="C"))
+    graph.add_edge(Edge(id="e2", source="B", target="C"))
+    assert graph.adjacency is not first
+    assert graph.adjacency["B"] == ["A", "C"]
+
+
+def test_remove_node_drops_incident_edges():
+    graph = Graph(id="g")
+    for node_id in "ABC":
+        graph.add_node(Node(id=node_id))
+    graph.add_edge(Edge(id="e1", source="A", target="B"))
+    graph.add_edge(Edge(id="e2", source="B", target="C"))
+    version = graph.version
+
+    removed = graph.remove_node("B")
+
+    assert removed.graph is None
+    assert graph.version > version
+    assert graph.get_node("B") is None
+    assert graph.get_edge("e1") is None and graph.edges == []
+    assert graph.adjacency == {"A": [], "C": []}
+
+    with pytest.raises(KeyError):
+        graph.remove_edge("e1")
+
+
+def test_node_views_use_incident_edges():
+    graph = Graph(id="g")
+    for node_id in "ABCD":
+        graph.add_node(Node(id=node_id))
+    graph.add_edge(Edge(id="e1", source="A", target="B"))
+    graph.add_edge(Edge(id="e2", source="C", target="A"))
+    graph.add_edge(Edge(id="e3", source="A", target="B"))
+    graph.add_edge(Edge(id="loop", source="A", target="A"))
+
+    node = graph.get_node("A")
+    assert [e.id for e in node.edges] == ["e1", "e3", "loop", "e2"]
+    assert [n.id for n in node.neighbors] == ["B", "A", "C"]
+    assert [e.id for e in graph.in_edges("B")] == ["e1", "e3"]
+    assert graph.get_node("D").neighbors == []
+
+    graph.remove_edge("e1")
+    assert [e.id for e in graph.out_edges("A")] == ["e3", "loop"]
+
+
+def test_bulk_loading_accepts_rows_and_columns():
+    graph = Graph(id="g")
+    graph.add_nodes_from(["A", ("B", {"name": "bee"}), {"id": "C"}, Node(id="D")])
+    graph.add_edges_from({"id": ["e1", "e2"], "source": ["A", "B"], "target": ["B", "C"]})
+    graph.add_edges_from([("e3", "C", "D"), ("e4", "D", "A", {"name": "back"})])
+
+    assert [n.id for n in graph.nodes] == ["A", "B", "C", "D"]
+    assert graph.get_node("B").name == "bee"
+    assert graph.get_node("A").graph is graph
+    assert graph.get_edge("e4").name == "back"
+    assert [n.id for n in graph.get_node("C").neighbors] == ["D", "B"]
+    assert graph.adjacency["A"] == ["B", "D"]
+
+
+def test_slots_record_mode_round_trip():
+    graph = Graph(id="g", record_mode="slots", nodes=[Node(id="A")])
+    graph.add_nodes_from(["B", ("C", {"properties": {"city": "Bonn"}})], node_type=PropertyNode)
+    graph.add_edges_from([("e1", "A", "B"), ("e2", "B", "C", {"name": "bc"})])
+    graph.add_edge(Edge(id="e3", source="C", target="A"))
+
+    assert all(isinstance(node, NodeRecord) for node in graph.nodes)
+    assert all(isinstance(edge, EdgeRecord) for edge in graph.edges)
+    assert graph.get_node("C").properties == {"city": "Bonn"}
+    assert [n.id for n in graph.get_node("B").neighbors] == ["C", "A"]
+    assert graph.search_nodes("bonn")[0].resolve(graph) is graph.get_node("C")
+    assert graph.get_node("C") in graph
+
+    models = graph.to_pydantic()
+    assert models.record_mode == "pydantic"
+    assert isinstance(models.get_node("C"), PropertyNode)
+    assert models.get_node("C").get_property("city") == "Bonn"
+    assert models.get_edge("e2").name == "bc"
+    assert models.get_node("A").graph is models
+
+
+@pytest.mark.parametrize("record_mode", ["pydantic", "slots"])
+def test_record_modes_build_the_same_weighted_graph(record_mode):
+    rows = [("e1", "A", "B", {"weight": 5}), ("e2", "A", "C", {"weight": 2})]
+    graph = Graph(id="g", record_mode=record_mode)
+    graph.add_nodes_from("ABC")
+    graph.add_edges_from(rows, edge_type=WeightedEdge)
+
+    assert graph.weighted_adjacency["A"] == [("B", 5.0), ("C", 2.0)]
+    assert graph.to_pydantic().weighted_adjacency == graph.weighted_adjacency
+    assert graph.to_pydantic().get_edge("e1").weight == 5
+    if record_mode == "slots":
+        with pytest.raises(ValueError, match="weight"):
+            graph.add_edges_from([("e3", "B", "C", {"weight": 1})])
+        with pytest.raises(ValueError, match="colour"):
+            NodeRecord("D", colour="red")
+
+
+def test_slots_record_mode_serializes_as_models():
+    nodes = [Node(id="A"), PropertyNode(id="B", name="bee")]
+    edges = [Edge(id="e1", source="A", target="B", name="ab")]
+    slots = Graph(id="g", record_mode="slots", nodes=nodes, edges=edges)
+    models = Graph(id="g", nodes=nodes, edges=edges)
+
+    data = slots.model_dump()
+    assert data["nodes"] == [{"id": "A", "name": None}, {"id": "B", "name": "bee"}]
+    assert data["edges"] == [{"id": "e1", "name": "ab", "source": "A", "target": "B"}]
+    assert slots.model_dump_json().replace('"slots"', '"pydantic"') == models.model_dump_json()
+
+
+def test_asearch_nodes_runs_on_executor_with_deadline():
+    graph = Graph(id="g")
+    graph.add_nodes_from([("A", {"properties": {"city": "Bonn"}}), "B"], node_type=PropertyNode)
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            found = await graph.asearch_nodes("bonn", executor=executor)
+            blocked = executor.submit(time.sleep, 0.2)
+            with pytest.raises(asyncio.TimeoutError):
+                await graph.asearch_nodes("bonn", executor=executor, timeout=0.01)
+            blocked.result()
+        return found
+
+    assert [result.resolve(graph).id for result in asyncio.run(run())] == ["A"]
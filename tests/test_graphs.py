@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from graph_py.core import Edge, Node, WeightedEdge
+from graph_py.graphs import DirectedGraph, UndirectedGraph
+
+
+def test_undirected_duplicates_keep_first_edge():
+    graph = UndirectedGraph(id="g")
+    for node_id in "AB":
+        graph.add_node(Node(id=node_id))
+    graph.add_edge(Edge(id="e1", source="A", target="B"))
+    graph.add_edge(Edge(id="e2", source="B", target="A"))
+    graph.add_edge(Edge(id="e3", source="A", target="B"))
+
+    assert [e.id for e in graph.edges] == ["e1"]
+    assert graph.get_edge("e2") is None
+    assert graph.has_edge_between("B", "A")
+
+    graph.remove_edge("e1")
+    assert not graph.has_edge_between("A", "B")
+    graph.add_edge(Edge(id="e2", source="B", target="A"))
+    assert [e.id for e in graph.edges] == ["e2"]
+
+
+def test_directed_neighborhoods_and_degrees():
+    graph = DirectedGraph(id="g")
+    for node_id in "ABC":
+        graph.add_node(Node(id=node_id))
+    graph.add_edge(Edge(id="e1", source="A", target="B"))
+    graph.add_edge(Edge(id="e2", source="A", target="B"))
+    graph.add_edge(Edge(id="e3", source="C", target="B"))
+    graph.add_edge(Edge(id="e4", source="B", target="C"))
+
+    assert [n.id for n in graph.successors("A")] == ["B"]
+    assert [n.id for n in graph.predecessors("B")] == ["A", "C"]
+    assert graph.out_degree("A") == 2 and graph.in_degree("B") == 3
+    assert graph.in_degree("A") == 0
+    assert graph.reverse_adjacency == {"A": [], "B": ["A", "A", "C"], "C": ["B"]}
+
+
+def test_csr_snapshot_layout_and_cache():
+    graph = DirectedGraph(id="g")
+    for node_id in "ABC":
+        graph.add_node(Node(id=node_id))
+    graph.add_edge(Edge(id="e1", source="A", target="B"))
+    graph.add_edge(Edge(id="e2", source="A", target="C"))
+    graph.add_edge(Edge(id="e3", source="C", target="B"))
+
+    csr = graph.to_csr()
+    assert graph.to_csr() is csr
+    assert list(csr.indptr) == [0, 2, 2, 3]
+    assert list(csr.indices) == [1, 2, 1]
+    assert list(csr.reverse().neighbors(csr.index_of("B"))) == [(0, 1.0), (2, 1.0)]
+    with pytest.raises(AttributeError):
+        csr.id = "other"
+
+    graph.add_node(Node(id="D"))
+    assert graph.to_csr() is not csr
+    assert len(graph.to_csr()) == 4
+
+
+def test_adjacency_matrix_keeps_lightest_parallel_edge():
+    np = pytest.importorskip("numpy")
+    graph = DirectedGraph(id="g")
+    for node_id in "ABC":
+        graph.add_node(Node(id=node_id))
+    graph.add_edge(WeightedEdge(id="e1", source="A", target="B", weight=3))
+    graph.add_edge(WeightedEdge(id="e2", source="A", target="B", weight=2))
+    graph.add_edge(WeightedEdge(id="e3", source="C", target="A", weight=-1))
+
+    matrix = graph.to_adjacency_matrix(dtype="float32")
+    assert matrix.dtype == np.float32
+    assert matrix.tolist() == [[np.inf, 2, np.inf], [np.inf, np.inf, np.inf], [-1, np.inf, np.inf]]
@@ -56,3 +56,19 @@ def test_union_with_undirected_graph_deduplicates_edges():
     assert isinstance(result, UndirectedGraph)
     assert {node.id for node in result.nodes} == {"A", "B"}
     assert len(result.edges) == 1
+
+
+def test_union_keeps_slots_record_mode():
+    g1 = DirectedGraph(id="g1", record_mode="slots")
+    g1.add_nodes_from(["A", "B"])
+    g1.add_edges_from([("e1", "A", "B")])
+    g2 = DirectedGraph(id="g2", record_mode="slots")
+    g2.add_nodes_from(["B", "C"])
+    g2.add_edges_from([("e2", "B", "C")])
+
+    result = graph_union(g1, g2)
+
+    assert result.record_mode == "slots"
+    assert {edge.id for edge in result.edges} == {"e1", "e2"}
+    assert result.get_node("A").graph is result
+    assert g1.get_node("A").graph is g1
@@ -0,0 +1,501 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import pytest
+
+from graph_py.algorithms import (
+    ContractionHierarchy,
+    LandmarkIndex,
+    adijkstra,
+    alt,
+    astar,
+    batch_shortest_paths,
+    bellman_ford,
+    bfs,
+    dfs,
+    dijkstra,
+    euclidean_heuristic,
+    floyd_warshall,
+    haversine_heuristic,
+    johnson,
+    multi_source_bfs,
+    predecessor_path,
+    single_source_bellman_ford,
+    single_source_dijkstra,
+)
+from graph_py.core import Edge, NegativeCycleError, Node, PropertyNode, WeightedEdge
+from graph_py.graphs import DirectedGraph, UndirectedGraph
+
+
+def _build(graph_cls, node_ids, edges):
+    graph = graph_cls(id="g")
+    for node_id in node_ids:
+        graph.add_node(Node(id=node_id))
+    for source, target, weight in edges:
+        graph.add_edge(WeightedEdge(id=f"{source}-{target}", source=source, target=target, weight=weight))
+    return graph
+
+
+def _ids(path):
+    return None if path is None else [node.id for node in path]
+
+
+@pytest.fixture
+def directed():
+    return _build(
+        DirectedGraph,
+        "ABCDE",
+        [("A", "B", 1), ("B", "C", 1), ("A", "C", 5), ("C", "D", 1), ("E", "A", 1)],
+    )
+
+
+@pytest.mark.parametrize("algorithm", [bfs, dfs, dijkstra, bellman_ford])
+def test_respects_direction_and_reachability(directed, algorithm):
+    get = directed.get_node
+    assert _ids(algorithm(directed, get("A"), get("A"))) == ["A"]
+    assert algorithm(directed, get("D"), get("A")) is None
+    assert _ids(algorithm(directed, get("E"), get("D")))[-1] == "D"
+
+
+def test_weighted_shortest_paths(directed):
+    get = directed.get_node
+    assert _ids(bfs(directed, get("A"), get("C"))) == ["A", "C"]
+    assert _ids(dijkstra(directed, get("A"), get("D"))) == ["A", "B", "C", "D"]
+    assert _ids(bellman_ford(directed, get("A"), get("D"))) == ["A", "B", "C", "D"]
+
+
+def test_negative_weights():
+    graph = _build(DirectedGraph, "ABC", [("A", "B", 4), ("A", "C", 1), ("B", "C", -5)])
+    get = graph.get_node
+    assert _ids(bellman_ford(graph, get("A"), get("C"))) == ["A", "B", "C"]
+    with pytest.raises(ValueError):
+        dijkstra(graph, get("B"), get("C"))
+
+    graph.add_edge(WeightedEdge(id="CB", source="C", target="B", weight=1))
+    with pytest.raises(ValueError):
+        bellman_ford(graph, get("A"), get("C"))
+
+
+def test_undirected_paths_follow_both_directions():
+    graph = _build(UndirectedGraph, "ABC", [("B", "A", 2), ("C", "B", 2)])
+    get = graph.get_node
+    assert _ids(dijkstra(graph, get("A"), get("C"))) == ["A", "B", "C"]
+    assert _ids(dfs(graph, get("C"), get("A"))) == ["C", "B", "A"]
+
+
+@pytest.mark.parametrize("algorithm", [bfs, dfs, dijkstra, bellman_ford])
+@pytest.mark.parametrize("graph_cls", [DirectedGraph, UndirectedGraph])
+def test_csr_snapshot_matches_object_graph(algorithm, graph_cls):
+    graph = _build(
+        graph_cls,
+        "ABCDEF",
+        [("A", "B", 2), ("B", "C", 2), ("A", "D", 1), ("D", "C", 4), ("C", "E", 1), ("F", "E", 1)],
+    )
+    csr = graph.to_csr()
+    for source in graph.nodes:
+        for target in graph.nodes:
+            assert _ids(algorithm(csr, source, target)) == _ids(algorithm(graph, source, target))
+
+
+def test_weighted_adjacency_uses_each_edge_weight():
+    graph = _build(DirectedGraph, "AB", [("A", "B", 5)])
+    graph.add_edge(WeightedEdge(id="AB2", source="A", target="B", weight=2))
+    graph.add_edge(Edge(id="BA", source="B", target="A"))
+
+    assert graph.weighted_adjacency == {"A": [("B", 5.0), ("B", 2.0)], "B": [("A", 1.0)]}
+    assert list(graph.to_csr().weights) == [5.0, 2.0, 1.0]
+
+    slots = DirectedGraph(id="s", record_mode="slots", nodes=graph.nodes, edges=graph.edges)
+    assert slots.weighted_adjacency == graph.weighted_adjacency
+
+
+class Road(Edge):
+    weight: float = 1.0
+
+
+@pytest.mark.parametrize("edge_type", [WeightedEdge, Road])
+def test_weight_assignment_refreshes_cached_views(edge_type):
+    graph = DirectedGraph(id="g")
+    graph.add_nodes_from("ABC")
+    graph.add_edges_from([("A-B", "A", "B", {"weight": 1}), ("B-C", "B", "C", {"weight": 1}), ("A-C", "A", "C", {"weight": 3})], edge_type=edge_type)
+    other = DirectedGraph(id="other", nodes=[Node(id="X"), Node(id="Y")], edges=[edge_type(id="X-Y", source="X", target="Y")])
+    get = graph.get_node
+    assert _ids(dijkstra(graph, get("A"), get("C"))) == ["A", "B", "C"]
+    version, other_csr = graph.version, other.to_csr()
+
+    graph.get_edge("A-B").weight = 9
+    assert graph.version == version
+    assert graph.weighted_adjacency["A"] == [("B", 9.0), ("C", 3.0)]
+    assert list(graph.to_csr().weights) == [9.0, 3.0, 1.0]
+    assert _ids(dijkstra(graph, get("A"), get("C"))) == ["A", "C"]
+    assert _ids(bellman_ford(graph, get("A"), get("C"))) == ["A", "C"]
+    assert other.to_csr() is other_csr
+
+    removed = graph.remove_edge("A-C")
+    removed.weight = 0
+    assert graph.weighted_adjacency["A"] == [("B", 9.0)]
+
+
+@pytest.mark.parametrize("as_csr", [False, True])
+@pytest.mark.parametrize("graph_cls", [DirectedGraph, UndirectedGraph])
+def test_bidirectional_bfs_finds_shortest_paths(graph_cls, as_csr):
+    edges = [(str(i), str(j), 1) for i in range(12) for j in (2 * i + 1, 3 * i + 2) if j < 12]
+    graph = _build(graph_cls, [str(i) for i in range(12)], edges)
+    searchable = graph.to_csr() if as_csr else graph
+    for source in graph.nodes:
+        for target in graph.nodes:
+            expected = bfs(searchable, source, target)
+            found = bfs(searchable, source, target, bidirectional=True)
+            if expected is None:
+                assert found is None
+                continue
+            assert len(found) == len(expected)
+            assert found[0] is source and found[-1] is target
+            for a, b in zip(found, found[1:]):
+                assert b.id in graph.adjacency[a.id]
+
+
+def _path_cost(graph, path):
+    weights = {(a, b): w for a, targets in graph.weighted_adjacency.items() for b, w in targets}
+    return sum(weights[(a.id, b.id)] for a, b in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("as_csr", [False, True])
+@pytest.mark.parametrize("graph_cls", [DirectedGraph, UndirectedGraph])
+def test_bidirectional_dijkstra_matches_dijkstra(graph_cls, as_csr):
+    edges = [
+        (str(i), str(j), float((i * 7 + j * 3) % 5 + 1))
+        for i in range(15)
+        for j in {i + 1, 2 * i + 3, (5 * i) % 15}
+        if j < 15 and j != i
+    ]
+    graph = _build(graph_cls, [str(i) for i in range(15)], edges)
+    searchable = graph.to_csr() if as_csr else graph
+    for source in graph.nodes:
+        for target in graph.nodes:
+            expected = dijkstra(searchable, source, target)
+            found = dijkstra(searchable, source, target, bidirectional=True)
+            if expected is None:
+                assert found is None
+                continue
+            assert found[0] is source and found[-1] is target
+            assert _path_cost(graph, found) == _path_cost(graph, expected)
+
+
+def _coordinate_grid(side):
+    graph = UndirectedGraph(id="grid")
+    for r in range(side):
+        for c in range(side):
+            graph.add_node(PropertyNode(id=f"{r},{c}", properties={"x": c, "y": r, "lat": r / 10, "lon": c / 10}))
+    for r in range(side):
+        for c in range(side):
+            if c + 1 < side:
+                graph.add_edge(WeightedEdge(id=f"h{r},{c}", source=f"{r},{c}", target=f"{r},{c + 1}", weight=1.0 + (r % 3)))
+            if r + 1 < side:
+                graph.add_edge(WeightedEdge(id=f"v{r},{c}", source=f"{r},{c}", target=f"{r + 1},{c}", weight=1.0 + (c % 2)))
+    return graph
+
+
+@pytest.mark.parametrize("as_csr", [False, True])
+def test_astar_matches_dijkstra_with_fewer_expansions(as_csr):
+    graph = _coordinate_grid(8)
+    searchable = graph.to_csr() if as_csr else graph
+    source, target = graph.get_node("0,0"), graph.get_node("7,7")
+
+    blind, guided = {}, {}
+    expected = dijkstra(searchable, source, target)
+    assert _path_cost(graph, astar(searchable, source, target, stats=blind)) == _path_cost(graph, expected)
+    path = astar(searchable, source, target, euclidean_heuristic(), stats=guided)
+    assert _path_cost(graph, path) == _path_cost(graph, expected)
+    assert guided["expansions"] < blind["expansions"]
+
+    haversine = haversine_heuristic(scale=0.0)
+    assert _path_cost(graph, astar(searchable, source, target, haversine)) == _path_cost(graph, expected)
+    assert haversine_heuristic()(source, target) > 0
+
+
+@pytest.mark.parametrize("strategy", ["farthest", "degree"])
+@pytest.mark.parametrize("graph_cls", [DirectedGraph, UndirectedGraph])
+def test_alt_landmarks_are_admissible_and_serializable(graph_cls, strategy, tmp_path):
+    edges = [
+        (str(i), str(j), float((i * 7 + j * 3) % 5 + 1))
+        for i in range(15)
+        for j in {i + 1, 2 * i + 3, (5 * i) % 15}
+        if j < 15 and j != i
+    ]
+    graph = _build(graph_cls, [str(i) for i in range(16)], edges)
+    index = LandmarkIndex.build(graph, k=3, strategy=strategy)
+    assert len(index.landmarks) == 3
+
+    index.save(str(tmp_path / "landmarks.bin"))
+    loaded = LandmarkIndex.load(str(tmp_path / "landmarks.bin"))
+    assert loaded.landmarks == index.landmarks
+    assert list(loaded.backward) == list(index.backward)
+
+    for source in graph.nodes:
+        for target in graph.nodes:
+            expected = dijkstra(graph, source, target)
+            found = alt(graph, source, target, loaded)
+            if expected is None:
+                assert found is None
+                continue
+            assert loaded.lower_bound(source.id, target.id) <= _path_cost(graph, expected)
+            assert _path_cost(graph, found) == _path_cost(graph, expected)
+
+
+@pytest.mark.parametrize("graph_cls", [DirectedGraph, UndirectedGraph])
+def test_contraction_hierarchy_matches_dijkstra(graph_cls, tmp_path):
+    edges = [
+        (str(i), str(j), float((i * 7 + j * 3) % 5 + 1))
+        for i in range(15)
+        for j in {i + 1, 2 * i + 3, (5 * i) % 15, (i * i) % 15}
+        if j < 15 and j != i
+    ]
+    graph = _build(graph_cls, [str(i) for i in range(16)], edges)
+    hierarchy = ContractionHierarchy.build(graph)
+    hierarchy.save(str(tmp_path / "graph.ch"))
+    loaded = ContractionHierarchy.load(str(tmp_path / "graph.ch"), graph)
+
+    for source in graph.nodes:
+        for target in graph.nodes:
+            expected = dijkstra(graph, source, target)
+            found = loaded.shortest_path(source, target)
+            if expected is None:
+                assert found is None
+                continue
+            assert found[0] is source and found[-1] is target
+            assert _path_cost(graph, found) == _path_cost(graph, expected)
+            assert hierarchy.distance(source, target) == _path_cost(graph, expected)
+
+
+@pytest.mark.parametrize("as_csr", [False, True])
+@pytest.mark.parametrize("single_source", [single_source_dijkstra, single_source_bellman_ford])
+def test_shortest_path_tree_matches_point_queries(directed, single_source, as_csr):
+    graph = directed.to_csr() if as_csr else directed
+    get = graph.get_node
+    tree = single_source(graph, get("A"))
+
+    assert len(tree) == 4 and get("E") not in tree
+    assert [tree.distance(get(node_id)) for node_id in "ABCDE"] == [0, 1, 2, 3, float("inf")]
+    assert tree.predecessor(get("C")) is get("B") and tree.predecessor(get("A")) is None
+    for node_id in "ABCDE":
+        assert tree.path_to(get(node_id)) == dijkstra(graph, get("A"), get(node_id))
+
+    assert set(_ids(single_source(graph, get("A"), cutoff=2))) == {"A", "B", "C"}
+
+
+def test_single_source_dijkstra_stops_at_targets():
+    graph = _build(DirectedGraph, "ABCD", [("A", "B", 1), ("B", "C", 1), ("C", "D", 1)])
+    get = graph.get_node
+    tree = single_source_dijkstra(graph, get("A"), targets=[get("B")])
+    assert _ids(tree) == ["A", "B"]
+    assert _ids(tree.path_to(get("B"))) == ["A", "B"]
+    assert tree.path_to(get("D")) is None
+
+
+@pytest.mark.parametrize("as_csr", [False, True])
+@pytest.mark.parametrize("method", ["sweep", "spfa", "numpy"])
+def test_bellman_ford_methods_report_negative_cycles(method, as_csr):
+    if method == "numpy":
+        pytest.importorskip("numpy")
+    edges = [("A", "B", 4), ("A", "C", 1), ("B", "C", -5), ("C", "D", 2), ("D", "E", 1)]
+    graph = _build(DirectedGraph, "ABCDE", edges)
+    searchable = graph.to_csr() if as_csr else graph
+    get = searchable.get_node
+    assert _ids(bellman_ford(searchable, get("A"), get("E"), method=method)) == ["A", "B", "C", "D", "E"]
+
+    graph.add_edge(WeightedEdge(id="D-B", source="D", target="B", weight=1))
+    searchable = graph.to_csr() if as_csr else graph
+    with pytest.raises(NegativeCycleError) as caught:
+        bellman_ford(searchable, searchable.get_node("A"), searchable.get_node("E"), method=method)
+    cycle = caught.value.cycle
+    assert sorted(_ids(cycle)) == ["B", "C", "D"]
+    assert _path_cost(graph, cycle + cycle[:1]) < 0
+
+
+def test_bellman_ford_rejects_unknown_method(directed):
+    with pytest.raises(ValueError):
+        bellman_ford(directed, directed.get_node("A"), directed.get_node("D"), method="fastest")
+
+
+def test_bellman_ford_methods_agree_on_negative_edges():
+    pytest.importorskip("numpy")
+    potential = {str(i): (i * 37 % 11) / 3 for i in range(20)}
+    edges = [
+        (str(i), str(j), (i + 2 * j) % 4 + 1 + potential[str(i)] - potential[str(j)])
+        for i in range(20)
+        for j in {(i + 1) % 20, (3 * i + 7) % 20, (i * i) % 20}
+        if j != i
+    ]
+    graph = _build(DirectedGraph, [str(i) for i in range(20)], edges)
+    source = graph.get_node("0")
+    expected = single_source_bellman_ford(graph, source).distances
+    for method in ("spfa", "numpy"):
+        distances = single_source_bellman_ford(graph, source, method=method).distances
+        assert distances.keys() == expected.keys()
+        assert all(distances[node_id] == pytest.approx(expected[node_id]) for node_id in expected)
+
+
+@pytest.mark.parametrize("workers, method", [(None, "sweep"), (None, "spfa"), (2, "numpy")])
+def test_johnson_matches_bellman_ford(workers, method, tmp_path):
+    np = pytest.importorskip("numpy")
+    edges = [("A", "B", 4), ("A", "C", 1), ("B", "C", -5), ("C", "D", 2), ("D", "B", 4), ("E", "A", -1)]
+    graph = _build(DirectedGraph, "ABCDE", edges)
+    node_ids = graph.to_csr().node_ids
+
+    matrix = johnson(graph, method=method, workers=workers, out=str(tmp_path / "apsp.npy"))
+    assert isinstance(matrix, np.memmap)
+    for i, source_id in enumerate(node_ids):
+        tree = single_source_bellman_ford(graph, graph.get_node(source_id))
+        for j, target_id in enumerate(node_ids):
+            assert matrix[i, j] == pytest.approx(tree.distance(graph.get_node(target_id)))
+    assert np.array_equal(np.load(tmp_path / "apsp.npy"), matrix)
+
+    graph.add_edge(WeightedEdge(id="C-A", source="C", target="A", weight=-1))
+    with pytest.raises(NegativeCycleError):
+        johnson(graph, method=method)
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+@pytest.mark.parametrize("graph_cls", [DirectedGraph, UndirectedGraph])
+def test_floyd_warshall_matches_dijkstra(graph_cls, dtype):
+    np = pytest.importorskip("numpy")
+    edges = [
+        (str(i), str(j), float((i * 7 + j * 3) % 5 + 1))
+        for i in range(15)
+        for j in {i + 1, 2 * i + 3, (5 * i) % 15, (i * i) % 15}
+        if j < 15 and j != i
+    ]
+    graph = _build(graph_cls, [str(i) for i in range(16)], edges)
+    distances, predecessors = floyd_warshall(graph, dtype=dtype, block=4)
+    assert distances.dtype == np.dtype(dtype)
+
+    index = graph.to_csr().index
+    for source in graph.nodes:
+        for target in graph.nodes:
+            expected = dijkstra(graph, source, target)
+            found = predecessor_path(graph, predecessors, source, target)
+            distance = distances[index[source.id], index[target.id]]
+            if expected is None:
+                assert found is None and distance == np.inf
+                continue
+            assert found[0] is source and found[-1] is target
+            assert _path_cost(graph, found) == _path_cost(graph, expected) == distance
+
+
+@pytest.mark.parametrize("block", [1, 2, 3, 4])
+def test_floyd_warshall_zero_weight_edges(block):
+    np = pytest.importorskip("numpy")
+    edges = [(str(i), str(j), float((i * 2 + j) % 4)) for i in range(12) for j in {(i + 1) % 12, (i * 3 + 4) % 12} if j > i]
+    graph = _build(UndirectedGraph, [str(i) for i in range(12)], edges)
+    distances, predecessors = floyd_warshall(graph, block=block)
+
+    index = graph.to_csr().index
+    for source in graph.nodes:
+        for target in graph.nodes:
+            found = predecessor_path(graph, predecessors, source, target)
+            assert found[0] is source and found[-1] is target
+            assert _path_cost(graph, found) == _path_cost(graph, dijkstra(graph, source, target))
+            assert distances[index[source.id], index[target.id]] == _path_cost(graph, found)
+    assert np.all(np.diag(distances) == 0)
+
+
+@pytest.mark.parametrize("block", [2, 3, 8])
+def test_floyd_warshall_negative_edges_and_cycles(block):
+    pytest.importorskip("numpy")
+    graph = _build(DirectedGraph, "ABCD", [("A", "B", 4), ("A", "C", 1), ("B", "C", -5), ("C", "D", 2)])
+    distances, predecessors = floyd_warshall(graph, block=block)
+    get = graph.get_node
+    assert _ids(predecessor_path(graph, predecessors, get("A"), get("D"))) == ["A", "B", "C", "D"]
+    assert distances[0, 3] == 1
+
+    graph.add_edge(WeightedEdge(id="D-B", source="D", target="B", weight=1))
+    graph.add_edge(WeightedEdge(id="D-A", source="D", target="A", weight=3))
+    with pytest.raises(NegativeCycleError) as caught:
+        floyd_warshall(graph, block=block)
+    assert sorted(_ids(caught.value.cycle)) == ["B", "C", "D"]
+    assert _path_cost(graph, caught.value.cycle + caught.value.cycle[:1]) < 0
+
+
+@pytest.mark.parametrize("block", [2, 3, 9])
+def test_floyd_warshall_reports_a_negative_cycle(block):
+    pytest.importorskip("numpy")
+    edges = [(str(i), str(j), float((i * 2 + j) % 5 - 1)) for i in range(9) for j in {(i + 1) % 9, (i * 6 + 5) % 9} if j != i]
+    graph = _build(DirectedGraph, [str(i) for i in range(9)], edges)
+    with pytest.raises(NegativeCycleError) as caught:
+        floyd_warshall(graph, block=block)
+    cycle = caught.value.cycle
+    assert _path_cost(graph, cycle + cycle[:1]) < 0
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+@pytest.mark.parametrize("graph_cls", [DirectedGraph, UndirectedGraph])
+def test_multi_source_bfs_matches_bfs_hops(graph_cls, with_numpy, monkeypatch):
+    if with_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    node_ids = [str(i) for i in range(90)]
+    edges = [(str(i), str(j), 1.0) for i in range(90) for j in {(i * 3 + 1) % 97, (i + 5) % 97} if j < 90 and j != i]
+    graph = _build(graph_cls, node_ids, edges)
+    sources = [graph.get_node(str(i)) for i in range(90)] + [graph.get_node("0")]
+
+    rows = multi_source_bfs(graph, sources)
+    assert len(rows) == len(sources) and rows[0] == rows[-1]
+    index = graph.to_csr().index
+    for source, row in zip(sources[::7], rows[::7]):
+        for target in graph.nodes:
+            path = bfs(graph, source, target)
+            assert row[index[target.id]] == (-1 if path is None else len(path) - 1)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+@pytest.mark.parametrize("algorithm", [bfs, dfs, dijkstra, bellman_ford])
+def test_batch_shortest_paths_matches_single_queries(algorithm, workers):
+    edges = [(str(i), str(j), float((i + j) % 4 + 1)) for i in range(12) for j in {(i + 1) % 12, (i * 5) % 13} if j < 12 and j != i]
+    graph = _build(DirectedGraph, [str(i) for i in range(13)], edges)
+    pairs = [(source, target) for source in graph.nodes for target in graph.nodes]
+
+    paths = batch_shortest_paths(graph, pairs, algorithm.__name__, workers=workers, chunk_size=40)
+    assert paths == [algorithm(graph, source, target) for source, target in pairs]
+
+    with pytest.raises(ValueError):
+        batch_shortest_paths(graph, pairs[:1], "teleport")
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_batch_shortest_paths_reports_negative_cycle_nodes(workers):
+    graph = _build(DirectedGraph, "ABC", [("A", "B", 1), ("B", "A", -2), ("B", "C", 1)])
+    pairs = [(graph.get_node("A"), graph.get_node("C"))] * 2
+    with pytest.raises(NegativeCycleError) as caught:
+        batch_shortest_paths(graph, pairs, "bellman_ford", workers=workers)
+    assert sorted(_ids(caught.value.cycle)) == ["A", "B"]
+
+
+@pytest.mark.parametrize("as_csr", [False, True])
+def test_adijkstra_yields_to_the_loop(as_csr):
+    graph = _coordinate_grid(12)
+    searchable = graph.to_csr() if as_csr else graph
+    source, target = graph.get_node("0,0"), graph.get_node("11,11")
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def run(**options):
+        background = asyncio.ensure_future(ticker())
+        try:
+            return await adijkstra(searchable, source, target, yield_every=8, **options)
+        finally:
+            background.cancel()
+
+    assert asyncio.run(run()) == dijkstra(searchable, source, target)
+    assert len(ticks) > 5
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run(timeout=0))
+    with pytest.raises(ValueError):
+        asyncio.run(adijkstra(searchable, source, target, yield_every=0))